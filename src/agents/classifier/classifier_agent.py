@@ -2,6 +2,7 @@
 import os
 import time
 from typing import Dict, Any, Optional
+from dataclasses import asdict
 from pathlib import Path
 
 from ...core.base_agent import BaseAgent
@@ -67,7 +68,7 @@ class ClassifierAgent(BaseAgent):
                 confidence=pipeline_recommendation['confidence'],
                 complexity_score=complexity_result['complexity_score'],
                 metadata={
-                    'file_metadata': file_metadata.__dict__,
+                    'file_metadata': asdict(file_metadata),
                     'content_analysis': complexity_result,
                     'pipeline_reasoning': pipeline_recommendation['reasoning']
                 },
@@ -17,8 +17,7 @@ class RawDataExtractor:
         Returns:
             Raw text content as string
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._read_file, file_path)
+        return await asyncio.to_thread(self._read_file, file_path)
     
     def _read_file(self, file_path: str) -> str:
         """
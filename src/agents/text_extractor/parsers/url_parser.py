@@ -8,88 +8,158 @@ pip install scrapy
 
 Usage:
 python scrapy_extractor.py https://example.com
+python scrapy_extractor.py https://example.com output.json --pretty
+python scrapy_extractor.py https://example.com https://example.org output.json
 """
 
+import argparse
 import scrapy
 from scrapy.crawler import CrawlerProcess
+from scrapy.http import HtmlResponse
 from scrapy.utils.project import get_project_settings
-import json
-import sys
+import copy
+import gzip
+import importlib.util
 import os
+import zlib
 from datetime import datetime
+from urllib.error import HTTPError
 from urllib.parse import urljoin, urlparse
+from urllib.request import Request, urlopen
 import logging
+import lxml.html
+from lxml import etree
+
+if __package__:
+    from ....core import compat_json as json
+else:
+    # Running as a standalone script outside the package
+    import json
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+DEFAULT_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0'
+}
+
+# Upper bound on parallel downloads for multi-URL crawls
+MAX_CONCURRENT_REQUESTS = 8
+
+def parse_html_tree(response):
+    """
+    Parse the response body bytes into an lxml document.
+
+    libxml2 decodes the bytes itself, so the full-page unicode copy that
+    ``response.text``/``response.selector`` would build is never created.
+    Falls back to Scrapy's selector tree for encodings libxml2 does not know
+    or bodies it cannot parse (e.g. empty documents).
+    """
+    try:
+        parser = lxml.html.HTMLParser(encoding=response.encoding)
+        return lxml.html.document_fromstring(response.body, parser=parser)
+    except (LookupError, etree.ParserError):
+        return response.selector.root
 
 class WebContentSpider(scrapy.Spider):
     name = 'web_content'
     
-    def __init__(self, start_url=None, output_file=None, *args, **kwargs):
+    # XPath expressions are compiled once for the spider's lifetime. Results
+    # are plain strings (smart_strings=False) since parent links are not needed.
+    _XP_TITLE = etree.XPath('//title/text()', smart_strings=False)
+    _XP_META_CONTENT = etree.XPath('//meta[@name=$name]/@content', smart_strings=False)
+    _XP_HEADINGS = tuple(
+        (f'h{i}', etree.XPath(f'//h{i}/text()', smart_strings=False)) for i in range(1, 7)
+    )
+    _XP_PARAGRAPHS = etree.XPath('//p/text()', smart_strings=False)
+    _XP_TABLE_HEADERS = etree.XPath('.//th/text()', smart_strings=False)
+    _XP_ROW_CELLS = etree.XPath('(.//td | .//th)/text()', smart_strings=False)
+    # First text node inside an element (what Scrapy's '::text' .get() returns)
+    _XP_FIRST_TEXT = etree.XPath('(descendant::text())[1]', smart_strings=False)
+    
+    def __init__(self, start_url=None, output_file=None, start_urls=None, pretty=False, *args, **kwargs):
         super(WebContentSpider, self).__init__(*args, **kwargs)
-        self.start_urls = [start_url] if start_url else []
+        self.start_urls = list(start_urls) if start_urls else ([start_url] if start_url else [])
         self.output_file = output_file
+        self.pretty = pretty
         self.extracted_data = {}
+        # Every extracted page, by start URL index (multi-URL crawls)
+        self.extracted_pages = {}
         
+        # Output filename prefix, resolved once when there is a single start URL
+        self._domain = (
+            self._filename_domain(self.start_urls[0]) if len(self.start_urls) == 1 else None
+        )
+        
+    async def start(self):
+        """Scrapy 2.13+ entry point; yields the same requests as start_requests"""
+        for request in self.start_requests():
+            yield request
+    
     def start_requests(self):
         """Generate initial requests with custom headers"""
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            'Cache-Control': 'max-age=0'
-        }
-        
-        for url in self.start_urls:
+        for url_index, url in enumerate(self.start_urls):
             yield scrapy.Request(
                 url=url,
-                headers=headers,
+                headers=DEFAULT_HEADERS,
                 callback=self.parse,
                 dont_filter=True,
-                meta={'dont_retry': False}
+                meta={'dont_retry': False},
+                cb_kwargs={'url_index': url_index}
             )
     
-    def parse(self, response):
+    def parse(self, response, url_index=0):
         """Parse the response and extract content"""
         try:
             base_url = response.url
             
+            # Work on the lxml tree directly: iterating elements avoids building
+            # a Selector/SelectorList wrapper for every matched node
+            root = parse_html_tree(response)
+            
             # Extract all content
             content = {
                 'url': response.url,
                 'extraction_date': datetime.now().isoformat(),
                 'status_code': response.status,
-                'title': self.extract_title(response),
-                'meta_description': self.extract_meta_description(response),
-                'meta_keywords': self.extract_meta_keywords(response),
-                'headings': self.extract_headings(response),
-                'paragraphs': self.extract_paragraphs(response),
-                'links': self.extract_links(response, base_url),
-                'images': self.extract_images(response, base_url),
-                'text_content': self.extract_clean_text(response),
+                'title': self.extract_title(root),
+                'meta_description': self.extract_meta_description(root),
+                'meta_keywords': self.extract_meta_keywords(root),
+                'headings': self.extract_headings(root),
+                'paragraphs': self.extract_paragraphs(root),
+                'links': self.extract_links(root, base_url),
+                'images': self.extract_images(root, base_url),
+                'text_content': self.extract_clean_text(root),
                 'word_count': 0,
-                'forms': self.extract_forms(response),
-                'tables': self.extract_tables(response),
-                'scripts': self.extract_scripts(response),
-                'styles': self.extract_styles(response),
+                'forms': self.extract_forms(root),
+                'tables': self.extract_tables(root),
+                'scripts': self.extract_scripts(root),
+                'styles': self.extract_styles(root, base_url),
                 'page_size': len(response.body),
                 'encoding': response.encoding
             }
             
-            # Calculate word count
-            content['word_count'] = len(content['text_content'].split()) if content['text_content'] else 0
+            # Calculate word count (text_content is whitespace-normalized, so
+            # counting separators avoids building a list of every word)
+            text_content = content['text_content']
+            content['word_count'] = text_content.count(' ') + 1 if text_content else 0
             
             # Store data
             self.extracted_data = content
+            self.extracted_pages[url_index] = content
             
             # Save to file
-            self.save_to_json(content)
+            self.save_to_json(content, url_index)
             
             # Print summary
             self.print_summary(content)
@@ -103,99 +173,116 @@ class WebContentSpider(scrapy.Spider):
                 'extraction_date': datetime.now().isoformat()
             }
             self.extracted_data = error_data
-            self.save_to_json(error_data)
+            self.extracted_pages[url_index] = error_data
+            self.save_to_json(error_data, url_index)
     
-    def extract_title(self, response):
+    def extract_title(self, root):
         """Extract page title"""
-        title = response.css('title::text').get()
-        return title.strip() if title else ''
+        title = self._XP_TITLE(root)
+        return title[0].strip() if title else ''
     
-    def extract_meta_description(self, response):
+    def _meta_content(self, root, name):
+        """Content of the first <meta name=...> tag"""
+        content = self._XP_META_CONTENT(root, name=name)
+        return content[0].strip() if content else ''
+    
+    def extract_meta_description(self, root):
         """Extract meta description"""
-        meta_desc = response.css('meta[name="description"]::attr(content)').get()
-        return meta_desc.strip() if meta_desc else ''
+        return self._meta_content(root, 'description')
     
-    def extract_meta_keywords(self, response):
+    def extract_meta_keywords(self, root):
         """Extract meta keywords"""
-        meta_keywords = response.css('meta[name="keywords"]::attr(content)').get()
-        return meta_keywords.strip() if meta_keywords else ''
+        return self._meta_content(root, 'keywords')
     
-    def extract_headings(self, response):
-        """Extract all headings (h1-h6)"""
+    def extract_headings(self, root):
+        """Extract all unique headings (h1-h6), in document order"""
         headings = {}
-        for i in range(1, 7):
-            h_tags = response.css(f'h{i}::text').getall()
-            headings[f'h{i}'] = [tag.strip() for tag in h_tags if tag.strip()]
+        for level, xpath in self._XP_HEADINGS:
+            # dict keys act as an insertion-ordered set
+            texts = dict.fromkeys(text.strip() for text in xpath(root))
+            texts.pop('', None)
+            headings[level] = list(texts)
         return headings
     
-    def extract_paragraphs(self, response):
+    def extract_paragraphs(self, root):
         """Extract all paragraph content"""
-        paragraphs = response.css('p::text').getall()
-        return [p.strip() for p in paragraphs if p.strip()]
+        return [text.strip() for text in self._XP_PARAGRAPHS(root) if text.strip()]
     
-    def extract_links(self, response, base_url):
-        """Extract all links"""
+    def extract_links(self, root, base_url):
+        """Extract all unique links (by text and URL), in document order"""
         links = []
-        for link in response.css('a'):
-            href = link.css('::attr(href)').get()
-            text = link.css('::text').get()
+        seen = set()
+        base_netloc = urlparse(base_url).netloc
+        for link in root.iter('a'):
+            href = link.get('href')
             
             if href:
                 # Convert relative URLs to absolute
                 full_url = urljoin(base_url, href)
+                text = self._XP_FIRST_TEXT(link)
+                text = text[0].strip() if text else ''
+                
+                # Navigation menus often repeat the same link many times
+                key = (text, full_url)
+                if key in seen:
+                    continue
+                seen.add(key)
                 
                 links.append({
-                    'text': text.strip() if text else '',
+                    'text': text,
                     'url': full_url,
-                    'is_external': self.is_external_link(full_url, base_url)
+                    'is_external': self.is_external_link(full_url, base_netloc)
                 })
         
         return links
     
-    def extract_images(self, response, base_url):
+    def extract_images(self, root, base_url):
         """Extract all images"""
         images = []
-        for img in response.css('img'):
-            src = img.css('::attr(src)').get()
-            alt = img.css('::attr(alt)').get()
-            title = img.css('::attr(title)').get()
+        for img in root.iter('img'):
+            src = img.get('src')
             
             if src:
                 full_url = urljoin(base_url, src)
                 images.append({
                     'src': full_url,
-                    'alt': alt or '',
-                    'title': title or ''
+                    'alt': img.get('alt') or '',
+                    'title': img.get('title') or ''
                 })
         
         return images
     
-    def extract_clean_text(self, response):
+    def extract_clean_text(self, root):
         """Extract clean text content"""
-        # Remove script and style content
-        text_content = response.css('body *:not(script):not(style)::text').getall()
+        # Reuse the tree Scrapy already parsed instead of running another selector pass
+        body = root.find('body')
+        if body is None:
+            return ''
         
-        # Clean and join text
-        clean_text = ' '.join([text.strip() for text in text_content if text.strip()])
+        # Remove script and style content from a copy, keeping their tail text
+        body = copy.deepcopy(body)
+        etree.strip_elements(body, 'script', 'style', with_tail=False)
         
-        return clean_text
+        # Collapse all whitespace runs so words are separated by exactly one space
+        return ' '.join(' '.join(body.itertext()).split())
     
-    def extract_forms(self, response):
+    def extract_forms(self, root):
         """Extract form information"""
         forms = []
-        for form in response.css('form'):
+        for form in root.iter('form'):
             form_data = {
-                'action': form.css('::attr(action)').get() or '',
-                'method': (form.css('::attr(method)').get() or 'get').lower(),
+                'action': form.get('action') or '',
+                'method': (form.get('method') or 'get').lower(),
                 'inputs': []
             }
             
-            for input_tag in form.css('input, textarea, select'):
+            for input_tag in form.iter('input', 'textarea', 'select'):
                 input_data = {
-                    'type': input_tag.css('::attr(type)').get() or 'text',
-                    'name': input_tag.css('::attr(name)').get() or '',
-                    'placeholder': input_tag.css('::attr(placeholder)').get() or '',
-                    'required': bool(input_tag.css('::attr(required)').get())
+                    'type': input_tag.get('type') or 'text',
+                    'name': input_tag.get('name') or '',
+                    'placeholder': input_tag.get('placeholder') or '',
+                    # Boolean attribute: present (even as required="") means required
+                    'required': input_tag.get('required') is not None
                 }
                 form_data['inputs'].append(input_data)
             
@@ -203,21 +290,19 @@ class WebContentSpider(scrapy.Spider):
         
         return forms
     
-    def extract_tables(self, response):
+    def extract_tables(self, root):
         """Extract table data"""
         tables = []
-        for table in response.css('table'):
+        for table in root.iter('table'):
             table_data = {'headers': [], 'rows': []}
             
             # Extract headers
-            headers = table.css('th::text').getall()
-            table_data['headers'] = [h.strip() for h in headers]
+            table_data['headers'] = [text.strip() for text in self._XP_TABLE_HEADERS(table)]
             
             # Extract rows
-            for row in table.css('tr'):
-                cells = row.css('td::text, th::text').getall()
-                if cells:
-                    row_data = [cell.strip() for cell in cells]
+            for row in table.iter('tr'):
+                row_data = [text.strip() for text in self._XP_ROW_CELLS(row)]
+                if row_data:
                     table_data['rows'].append(row_data)
             
             if table_data['rows']:  # Only add tables with content
@@ -225,55 +310,68 @@ class WebContentSpider(scrapy.Spider):
         
         return tables
     
-    def extract_scripts(self, response):
+    def extract_scripts(self, root):
         """Extract script tags information"""
         scripts = []
-        for script in response.css('script'):
-            src = script.css('::attr(src)').get()
-            script_type = script.css('::attr(type)').get()
+        for script in root.iter('script'):
+            src = script.get('src')
             
             script_info = {
                 'src': src,
-                'type': script_type,
+                'type': script.get('type'),
                 'inline': src is None
             }
             scripts.append(script_info)
         
         return scripts
     
-    def extract_styles(self, response):
+    def extract_styles(self, root, base_url):
         """Extract stylesheet information"""
         styles = []
-        for link in response.css('link[rel="stylesheet"]'):
-            href = link.css('::attr(href)').get()
-            media = link.css('::attr(media)').get()
+        for link in root.iter('link'):
+            if link.get('rel') != 'stylesheet':
+                continue
+            href = link.get('href')
             
             if href:
                 styles.append({
-                    'href': urljoin(response.url, href),
-                    'media': media or 'all'
+                    'href': urljoin(base_url, href),
+                    'media': link.get('media') or 'all'
                 })
         
         return styles
     
-    def is_external_link(self, url, base_url):
-        """Check if a link is external"""
-        return urlparse(url).netloc != urlparse(base_url).netloc
+    def is_external_link(self, url, base_netloc):
+        """Check if a link is external to the (pre-parsed) base netloc"""
+        return urlparse(url).netloc != base_netloc
     
-    def save_to_json(self, content):
+    @staticmethod
+    def _filename_domain(url):
+        """Domain part used to name output files"""
+        return urlparse(url).netloc.replace('www.', '')
+    
+    def save_to_json(self, content, url_index=0):
         """Save extracted content to JSON file"""
         if self.output_file:
             filename = self.output_file
         else:
             # Generate filename from URL
-            parsed_url = urlparse(content.get('url', ''))
-            domain = parsed_url.netloc.replace('www.', '')
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"{domain}_{timestamp}.json"
+            domain = self._domain or self._filename_domain(content.get('url', ''))
+            filename = f"{domain}_{datetime.now():%Y%m%d_%H%M%S}.json"
+        
+        # One file per start URL: pages of a multi-URL crawl would otherwise
+        # share a name (same output file, or same domain within a second)
+        if len(self.start_urls) > 1:
+            stem, ext = os.path.splitext(filename)
+            filename = f"{stem}_{url_index + 1}{ext or '.json'}"
         
         try:
             with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(content, f, indent=2, ensure_ascii=False)
+                # Compact by default: output is mostly consumed by other tools
+                if self.pretty:
+                    json.dump(content, f, indent=2, ensure_ascii=False)
+                else:
+                    json.dump(content, f, separators=(',', ':'), ensure_ascii=False)
             print(f"\nContent saved to: {filename}")
         except Exception as e:
             self.logger.error(f"Error saving file: {str(e)}")
@@ -295,32 +393,63 @@ class WebContentSpider(scrapy.Spider):
         print(f"Encoding: {content['encoding']}")
         print(f"{'='*60}")
 
-def main():
-    """Main function to run the extractor"""
-    if len(sys.argv) < 2:
-        print("Usage: python scrapy_extractor.py <URL> [output_file]")
-        print("Example: python scrapy_extractor.py https://example.com")
-        print("Example: python scrapy_extractor.py https://example.com output.json")
-        sys.exit(1)
+def fetch_response(url, timeout=30):
+    """
+    Fetch a single URL without starting a Scrapy crawler.
+
+    Returns an HtmlResponse so the spider's extractors can be reused as-is.
+    """
+    # urllib does not decode brotli, so only advertise what we can inflate
+    headers = dict(DEFAULT_HEADERS, **{'Accept-Encoding': 'gzip, deflate'})
+    request = Request(url, headers=headers)
     
-    url = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else None
+    try:
+        with urlopen(request, timeout=timeout) as resp:
+            status, final_url, resp_headers, body = resp.status, resp.geturl(), resp.headers, resp.read()
+    except HTTPError as e:
+        # Error pages are still extracted, matching the spider's behaviour
+        status, final_url, resp_headers, body = e.code, e.geturl(), e.headers, e.read()
     
-    # Validate URL
-    if not url.startswith(('http://', 'https://')):
-        url = 'https://' + url
+    content_encoding = (resp_headers.get('Content-Encoding') or '').lower()
+    if 'gzip' in content_encoding:
+        body = gzip.decompress(body)
+    elif 'deflate' in content_encoding:
+        body = zlib.decompress(body)
     
-    print(f"Extracting content from: {url}")
-    print("Using Scrapy for robust web scraping...")
+    response_headers = {
+        key: value for key, value in resp_headers.items()
+        if key.lower() not in ('content-encoding', 'content-length')
+    }
+    return HtmlResponse(url=final_url, status=status, headers=response_headers, body=body)
+
+def extract_single(url, output_file=None, pretty=False):
+    """
+    Extract content from one URL using the lightweight fetch path.
+
+    Skips the CrawlerProcess/Twisted reactor bootstrap, which dominates the
+    runtime of a one-page extraction. Returns the extracted data.
+    """
+    spider = WebContentSpider(start_url=url, output_file=output_file, pretty=pretty)
+    spider.parse(fetch_response(url))
+    return spider.extracted_data
+
+def crawl(urls, output_file=None, pretty=False):
+    """
+    Extract content from URLs using a full Scrapy crawl.
+
+    With several URLs, each page is saved to its own file, suffixed with the
+    URL's 1-based position. Returns the extracted pages in URL order.
+    """
+    urls = list(urls)
     
     # Configure Scrapy settings
     settings = get_project_settings()
     settings.setdict({
-        'USER_AGENT': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'USER_AGENT': USER_AGENT,
         'ROBOTSTXT_OBEY': False,  # Ignore robots.txt for this scraper
         'DOWNLOAD_DELAY': 1,  # Delay between requests
         'RANDOMIZE_DOWNLOAD_DELAY': True,  # Randomize delay (0.5-1.5 * DOWNLOAD_DELAY)
-        'CONCURRENT_REQUESTS': 1,  # Only one request at a time
+        'CONCURRENT_REQUESTS': max(1, min(len(urls), MAX_CONCURRENT_REQUESTS)),
         'COOKIES_ENABLED': True,
         'TELNETCONSOLE_ENABLED': False,
         'LOG_LEVEL': 'WARNING',  # Reduce scrapy logging
@@ -336,10 +465,59 @@ def main():
         'AUTOTHROTTLE_TARGET_CONCURRENCY': 1.0,
     })
     
-    # Create and run the spider
+    # Multiplex requests over HTTP/2 when Twisted's http2 extra (h2) is installed
+    if importlib.util.find_spec('h2') is not None:
+        settings.set('DOWNLOAD_HANDLERS', {
+            'https': 'scrapy.core.downloader.handlers.http2.H2DownloadHandler',
+        })
+    
+    # Run a single spider over all URLs so requests share one connection pool
     process = CrawlerProcess(settings)
-    process.crawl(WebContentSpider, start_url=url, output_file=output_file)
+    crawler = process.create_crawler(WebContentSpider)
+    process.crawl(crawler, start_urls=urls, output_file=output_file, pretty=pretty)
     process.start()
+    
+    pages = crawler.spider.extracted_pages
+    return [pages[url_index] for url_index in sorted(pages)]
+
+def main():
+    """Main function to run the extractor"""
+    parser = argparse.ArgumentParser(
+        description="Extract content from a website URL and save it to a JSON file.",
+        epilog="Example: python scrapy_extractor.py https://example.com output.json"
+    )
+    parser.add_argument('urls', nargs='+', metavar='url [output_file]',
+                        help="URLs to extract content from, optionally followed by an "
+                             "output JSON file (default: <domain>_<timestamp>.json; "
+                             "several URLs get a _<n> suffix per URL)")
+    parser.add_argument('--pretty', action='store_true',
+                        help="Indent the JSON output for human reading")
+    args = parser.parse_args()
+    
+    urls = args.urls
+    output_file = None
+    # A trailing local .json path is the output file, not a URL
+    if len(urls) > 1 and urls[-1].endswith('.json') and '://' not in urls[-1]:
+        urls, output_file = urls[:-1], urls[-1]
+    
+    # Validate URLs
+    urls = [url if url.startswith(('http://', 'https://')) else 'https://' + url for url in urls]
+    
+    if len(urls) > 1:
+        # Scrapy's value is concurrency: crawl all URLs over shared connections
+        print(f"Extracting content from {len(urls)} URLs")
+        crawl(urls, output_file, pretty=args.pretty)
+        return
+    
+    url = urls[0]
+    print(f"Extracting content from: {url}")
+    
+    try:
+        extract_single(url, output_file, pretty=args.pretty)
+    except Exception as e:
+        # Network-level failures get Scrapy's retry/throttle machinery
+        print(f"Direct fetch failed ({e}), retrying with Scrapy...")
+        crawl([url], output_file, pretty=args.pretty)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
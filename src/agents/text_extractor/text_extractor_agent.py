@@ -1,4 +1,5 @@
 # src/agents/text_extractor/text_extractor_agent.py
+import asyncio
 import time
 from typing import Dict, Any, List
 from pathlib import Path
@@ -71,10 +72,12 @@ class TextExtractorAgent(BaseAgent):
             
             # Step 2: Parse structured content using appropriate parser
             parser = self.parsers[file_metadata.file_type]
-            # Adjusted to call parse with file_path as per parser interface
-            parse_result = parser.parse(file_path)
-            # Extract structured elements from parse_result
-            structured_elements = parse_result.get('content', {}).get('structured_elements', [])
+            # Parsers are synchronous and CPU-bound; run them in a worker thread
+            # so the event loop keeps serving other requests meanwhile
+            parse_result = await asyncio.to_thread(parser.parse, file_path)
+            # Parsers share a dict contract; the element list is used by reference
+            # (ExtractionResult below holds the same list object, not a copy)
+            structured_elements = parse_result['content']['structured_elements']
             self.logger.info(f"Parsed {len(structured_elements)} structured elements")
             
             # Step 3: Extract additional metadata
@@ -120,28 +123,33 @@ class TextExtractorAgent(BaseAgent):
             self._log_error(e, "text extraction")
             raise ExtractionError(f"Text extraction failed for {file_path}: {str(e)}") from e
     
-    async def process_batch(self, file_paths: List[str]) -> Dict[str, ExtractionResult]:
+    async def process_batch(self, file_paths: List[str], max_concurrency: int = 8) -> Dict[str, ExtractionResult]:
         """
         Process multiple text files in batch
         
+        Files are processed concurrently, bounded by a semaphore so large
+        batches do not exhaust file descriptors.
+        
         Args:
             file_paths: List of file paths to process
+            max_concurrency: Maximum number of files processed at once
             
         Returns:
             Dictionary mapping file paths to extraction results
         """
-        results = {}
-        
-        for file_path in file_paths:
-            try:
-                result = await self.process(file_path)
-                results[file_path] = result
-                self.logger.info(f"Successfully processed: {file_path}")
-            except Exception as e:
-                self.logger.error(f"Failed to process {file_path}: {str(e)}")
-                results[file_path] = None
-        
-        return results
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def process_one(file_path: str):
+            async with semaphore:
+                try:
+                    result = await self.process(file_path)
+                    self.logger.info("Successfully processed: %s", file_path)
+                    return file_path, result
+                except Exception as e:
+                    self.logger.error("Failed to process %s: %s", file_path, e)
+                    return file_path, None
+        
+        return dict(await asyncio.gather(*(process_one(path) for path in file_paths)))
     
     def _calculate_confidence_score(self, structured_elements: List[StructuredElement]) -> float:
         """Calculate confidence score based on extraction results"""
@@ -151,16 +159,22 @@ class TextExtractorAgent(BaseAgent):
         # Base confidence
         confidence = 0.8
         
-        # Adjust based on element confidence scores
-        element_confidences = [elem.confidence for elem in structured_elements if elem.confidence is not None]
-        if element_confidences:
-            avg_element_confidence = sum(element_confidences) / len(element_confidences)
-            confidence = (confidence + avg_element_confidence) / 2
+        # Adjust based on element confidence scores (single pass, no temporary list)
+        total_confidence = 0.0
+        scored_count = 0
+        for elem in structured_elements:
+            elem_confidence = elem.confidence
+            if elem_confidence is not None:
+                total_confidence += elem_confidence
+                scored_count += 1
+        if scored_count:
+            confidence = (confidence + total_confidence / scored_count) / 2
         
         # Adjust based on number of elements (more elements = higher confidence)
-        if len(structured_elements) > 10:
+        element_count = len(structured_elements)
+        if element_count > 10:
             confidence = min(confidence + 0.1, 1.0)
-        elif len(structured_elements) < 3:
+        elif element_count < 3:
             confidence = max(confidence - 0.1, 0.1)
         
         return round(confidence, 2)
@@ -1,7 +1,10 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.background import BackgroundTasks
+from contextlib import asynccontextmanager
+from functools import lru_cache
 import logging
 
 from config.settings import settings
@@ -16,28 +19,35 @@ from src.api.middleware.auth_middleware import AuthMiddleware
 from src.api.middleware.error_handler import ErrorHandlerMiddleware
 from src.api.middleware.logging_middleware import LoggingMiddleware
 
-from src.agents.text_extractor.text_extractor_agent import TextExtractorAgent
-from src.pipelines.pipeline_orchestrator import PipelineOrchestrator
+from src.core.compat_json import HAS_ORJSON
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Setup logging once the server starts rather than at import time
+    setup_logging()
+    yield
 
 app = FastAPI(
     title="Unstructured Data Integration Agent API",
     description="API for processing and extracting data from unstructured documents",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # Result payloads carry large raw_text/structured_elements fields
+    default_response_class=ORJSONResponse if HAS_ORJSON else JSONResponse
 )
 
-# Setup logging
-setup_logging()
-
-# Initialize agents and pipelines
-text_extractor_agent = TextExtractorAgent()
-pipeline_orchestrator = PipelineOrchestrator()
-
-# Dependency injection example (can be expanded as needed)
+# Dependency injection: agents and pipelines are built on first use, so
+# importing the app (worker fork, serverless cold start) stays cheap.
+# Use with Depends(get_text_extractor_agent) in routes.
+@lru_cache(maxsize=1)
 def get_text_extractor_agent():
-    return text_extractor_agent
+    from src.agents.text_extractor.text_extractor_agent import TextExtractorAgent
+    return TextExtractorAgent()
 
+@lru_cache(maxsize=1)
 def get_pipeline_orchestrator():
-    return pipeline_orchestrator
+    from src.pipelines.pipeline_orchestrator import PipelineOrchestrator
+    return PipelineOrchestrator()
 
 # Include routers with dependencies
 app.include_router(
@@ -111,6 +121,6 @@ async def process_file_task(file: bytes):
 # This main.py sets up the FastAPI app with metadata and includes routers for upload, process, status, and results endpoints.
 # CORS and trusted hosts middleware are configured for security and cross-origin support.
 # Custom middleware for authentication, logging, and error handling are added to ensure robust API behavior.
-# Dependency injection functions provide agents and pipelines to routers as needed.
+# Dependency injection functions lazily build agents and pipelines on first use and cache them.
 # Background tasks are supported for long-running operations like file processing.
 # The modular structure aligns with the project organization, keeping API routes, middleware, agents, and pipelines separate for maintainability.
@@ -23,24 +23,25 @@ Author: Unstructured Data Integration Team
 Version: 1.0.0
 """
 
-from typing import Dict, Any, List, Optional, Union, Type
+from typing import Dict, Any, List, Optional, Union, Type, Tuple
+import importlib
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
+from types import MappingProxyType
 
 # Import core components
-from .base_agent import BaseAgent
+from .base_agent import BaseAgent, configure_agent_logging
 from .data_models import (
     FileMetadata,
     ExtractionResult,
     ClassificationResult,
     ProcessingStatus,
-    AgentConfig,
-    PipelineConfig,
-    ValidationResult,
-    StructuredData,
-    ContentElement,
-    EntityData,
-    QualityMetrics
+    ValidationResult
 )
 from .constants import (
     SUPPORTED_FILE_TYPES,
@@ -51,19 +52,31 @@ from .constants import (
     QUALITY_THRESHOLDS,
     DEFAULT_CONFIG,
     FILE_SIZE_LIMITS,
-    PROCESSING_TIMEOUTS
+    FILE_VALIDATION_TABLE,
+    PROCESSING_TIMEOUTS,
+    CONCURRENCY_LIMITS,
+    EFFECTIVE_ENV
 )
 from .utils import (
     validate_file_path,
     get_file_metadata,
+    get_file_metadata_batch,
+    get_directory_metadata,
+    scan_file,
+    get_cached_file_metadata,
+    invalidate_file_metadata,
     calculate_file_hash,
     format_timestamp,
     sanitize_filename,
     create_directory_structure,
     merge_configurations,
+    merge_configurations_shallow,
+    get_env,
     validate_json_schema,
-    convert_bytes_to_mb,
-    estimate_processing_time
+    validate_file_metadata,
+    validate_extraction_result,
+    extract_all_entities,
+    convert_bytes_to_mb
 )
 from .exceptions import (
     UDIBaseException,
@@ -86,8 +99,9 @@ __description__ = "Core components for unstructured data integration"
 # Core logger
 logger = logging.getLogger(__name__)
 
-# System configuration
-CORE_CONFIG = {
+# System configuration (read-only and flat; overrides are merged into a new
+# dict with merge_configurations_shallow)
+CORE_CONFIG = MappingProxyType({
     'version': __version__,
     'max_concurrent_processes': 10,
     'default_timeout': 300,
@@ -95,7 +109,33 @@ CORE_CONFIG = {
     'cache_ttl': 3600,
     'log_level': 'INFO',
     'metrics_enabled': True
-}
+})
+
+
+@lru_cache(maxsize=32)
+def _merge_with_core(frozen_items: Tuple[Tuple[str, Any, type], ...]) -> Dict[str, Any]:
+    """Merge a frozen override onto CORE_CONFIG (memoized)."""
+    return merge_configurations_shallow(CORE_CONFIG, {key: value for key, value, _ in frozen_items})
+
+
+def _resolve_core_config(config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Return CORE_CONFIG merged with an optional override.
+    
+    Identical overrides reuse a cached merge; each caller gets its own copy.
+    Value types are part of the cache key so e.g. ``1`` and ``True`` stay distinct.
+    """
+    if not config:
+        return dict(_merge_with_core(()))
+    try:
+        frozen_items = tuple(sorted(
+            ((key, value, type(value)) for key, value in config.items()),
+            key=itemgetter(0)
+        ))
+        return dict(_merge_with_core(frozen_items))
+    except TypeError:
+        # Unhashable override values (e.g. nested dicts) cannot be cached
+        return merge_configurations_shallow(CORE_CONFIG, config)
 
 
 class CoreManager:
@@ -110,11 +150,11 @@ class CoreManager:
         Args:
             config: Optional configuration override
         """
-        self.config = merge_configurations(CORE_CONFIG, config or {})
+        self.config = _resolve_core_config(config)
         self._setup_logging()
         self._validate_environment()
         
-        logger.info(f"Core system initialized (v{__version__})")
+        logger.info("Core system initialized (v%s)", __version__)
     
     def _setup_logging(self):
         """Setup logging configuration."""
@@ -135,7 +175,7 @@ class CoreManager:
             logger.debug("Environment validation completed")
             
         except Exception as e:
-            logger.error(f"Environment validation failed: {e}")
+            logger.error("Environment validation failed: %s", e)
             raise ConfigurationError(f"Environment setup failed: {e}")
     
     def get_system_info(self) -> Dict[str, Any]:
@@ -171,33 +211,150 @@ class CoreManager:
                     error_message="Invalid file path"
                 )
             
-            # Get file metadata
-            metadata = get_file_metadata(file_path)
-            
-            # Check file size limits
-            file_size_mb = convert_bytes_to_mb(metadata.file_size)
-            max_size = FILE_SIZE_LIMITS.get(metadata.file_type, 100)
-            
-            if file_size_mb > max_size:
+            # Cheap checks first: type and size need only the name and a
+            # stat, so files that fail them are never hashed
+            file_type = os.path.splitext(file_path)[1].lower().lstrip('.')
+            max_size = FILE_VALIDATION_TABLE.get(file_type)
+            if max_size is None:
                 return ValidationResult(
                     is_valid=False,
-                    error_message=f"File size ({file_size_mb}MB) exceeds limit ({max_size}MB)"
+                    error_message=f"Unsupported file type: {file_type}"
                 )
             
-            # Check file type support
-            if metadata.file_type not in SUPPORTED_FILE_TYPES:
+            file_size_mb = convert_bytes_to_mb(os.stat(file_path).st_size)
+            if file_size_mb > max_size:
                 return ValidationResult(
                     is_valid=False,
-                    error_message=f"Unsupported file type: {metadata.file_type}"
+                    error_message=f"File size ({file_size_mb}MB) exceeds limit ({max_size}MB)"
                 )
             
+            # Get file metadata (cached while the file is unchanged)
+            if self.config.get('enable_caching'):
+                metadata = get_cached_file_metadata(file_path, ttl=self.config.get('cache_ttl'))
+            else:
+                metadata = get_file_metadata(file_path)
+            
             return ValidationResult(
                 is_valid=True,
                 metadata=metadata
             )
             
         except Exception as e:
-            logger.error(f"File validation error: {e}")
+            logger.error("File validation error: %s", e)
+            return ValidationResult(
+                is_valid=False,
+                error_message=str(e)
+            )
+    
+    def validate_files_bulk(self, file_paths: List[str]) -> List[ValidationResult]:
+        """
+        Validate many files at once.
+        
+        Files are stat'ed with a single os.scandir() pass per parent directory,
+        and unsupported or oversized files are rejected before any hashing.
+        The remaining files have their metadata (including the checksum)
+        computed in parallel. Paths whose name does not appear verbatim in
+        the listing (missing files, or different case on case-insensitive
+        filesystems) are checked with validate_file, so results always match
+        validating each path on its own.
+        
+        Args:
+            file_paths: Paths of the files to validate
+            
+        Returns:
+            List of ValidationResult, in the same order as file_paths
+        """
+        results: List[Optional[ValidationResult]] = [None] * len(file_paths)
+        
+        # parent directory -> entry name -> indices into file_paths
+        by_directory: Dict[str, Dict[str, List[int]]] = {}
+        for index, file_path in enumerate(file_paths):
+            # Split as given: normalizing 'missing/../x' lexically would
+            # accept paths the OS rejects
+            parent, name = os.path.split(file_path)
+            by_directory.setdefault(parent or os.curdir, {}).setdefault(name, []).append(index)
+        
+        # (path, indices) of files that passed the type and size checks
+        pending: List[Tuple[str, List[int]]] = []
+        for parent, names in by_directory.items():
+            try:
+                with os.scandir(parent) as entries:
+                    for entry in entries:
+                        indices = names.pop(entry.name, None)
+                        if indices is None:
+                            continue
+                        rejection = self._prevalidate_entry(entry)
+                        if rejection is None:
+                            pending.append((file_paths[indices[0]], indices))
+                        else:
+                            for index in indices:
+                                results[index] = rejection
+            except OSError as e:
+                logger.warning("Cannot scan directory %s: %s", parent, e)
+            
+            # Listing names are matched exactly. A name missing from the
+            # listing is either absent or spelled in a different case on a
+            # case-insensitive filesystem; validate_file settles which.
+            for indices in names.values():
+                result = self.validate_file(file_paths[indices[0]])
+                for index in indices:
+                    results[index] = result
+        
+        if pending:
+            if self.config.get('enable_caching'):
+                ttl = self.config.get('cache_ttl')
+                fetch = lambda path: get_cached_file_metadata(path, ttl=ttl)
+            else:
+                fetch = get_file_metadata
+            
+            max_workers = min(CONCURRENCY_LIMITS['max_concurrent_files'], len(pending))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(fetch, path) for path, _ in pending]
+                for (path, indices), future in zip(pending, futures):
+                    try:
+                        result = ValidationResult(is_valid=True, metadata=future.result())
+                    except Exception as e:
+                        logger.error("File validation error: %s", e)
+                        result = ValidationResult(is_valid=False, error_message=str(e))
+                    for index in indices:
+                        results[index] = result
+        
+        return results
+    
+    @staticmethod
+    def _prevalidate_entry(entry: os.DirEntry) -> Optional[ValidationResult]:
+        """
+        Run the stat-only checks of validate_file against a directory entry.
+        
+        Returns:
+            A failed ValidationResult, or None if the entry passed
+        """
+        try:
+            if not entry.is_file() or not os.access(entry.path, os.R_OK):
+                return ValidationResult(
+                    is_valid=False,
+                    error_message="Invalid file path"
+                )
+            
+            file_type = os.path.splitext(entry.name)[1].lower().lstrip('.')
+            max_size = FILE_VALIDATION_TABLE.get(file_type)
+            if max_size is None:
+                return ValidationResult(
+                    is_valid=False,
+                    error_message=f"Unsupported file type: {file_type}"
+                )
+            
+            file_size_mb = convert_bytes_to_mb(entry.stat().st_size)
+            if file_size_mb > max_size:
+                return ValidationResult(
+                    is_valid=False,
+                    error_message=f"File size ({file_size_mb}MB) exceeds limit ({max_size}MB)"
+                )
+            
+            return None
+            
+        except OSError as e:
+            logger.error("File validation error: %s", e)
             return ValidationResult(
                 is_valid=False,
                 error_message=str(e)
@@ -217,6 +374,16 @@ def initialize_core_system(config: Optional[Dict[str, Any]] = None) -> CoreManag
     return CoreManager(config)
 
 
+# Agent type -> (module relative to this package, class name). Modules are
+# imported on first request only, so loading the core package stays light.
+_AGENT_CLASS_REGISTRY: Dict[str, Tuple[str, str]] = {
+    'classifier': ('..agents.classifier.classifier_agent', 'ClassifierAgent'),
+    'text_extractor': ('..agents.text_extractor.text_extractor_agent', 'TextExtractorAgent'),
+    # Add other agent types as implemented
+}
+
+
+@lru_cache(maxsize=None)
 def get_agent_class(agent_type: str) -> Type[BaseAgent]:
     """
     Get agent class by type name.
@@ -233,23 +400,20 @@ def get_agent_class(agent_type: str) -> Type[BaseAgent]:
     if agent_type not in AGENT_TYPES:
         raise ValueError(f"Unsupported agent type: {agent_type}")
     
+    try:
+        module_name, class_name = _AGENT_CLASS_REGISTRY[agent_type]
+    except KeyError:
+        raise ValueError(f"Agent type not yet implemented: {agent_type}") from None
+    
     # Dynamic import based on agent type
-    if agent_type == 'classifier':
-        from ..agents.classifier import ClassifierAgent
-        return ClassifierAgent
-    elif agent_type == 'text_extractor':
-        from ..agents.text_extractor import TextExtractorAgent
-        return TextExtractorAgent
-    # Add other agent types as implemented
-    else:
-        raise ValueError(f"Agent type not yet implemented: {agent_type}")
+    return getattr(importlib.import_module(module_name, __package__), class_name)
 
 
 def create_extraction_result(
     file_path: str,
     content: Dict[str, Any],
     metadata: Optional[FileMetadata] = None,
-    quality_metrics: Optional[QualityMetrics] = None
+    quality_metrics: Optional[Dict[str, Any]] = None
 ) -> ExtractionResult:
     """
     Create a standardized extraction result.
@@ -297,6 +461,7 @@ def validate_configuration(config: Dict[str, Any], schema: Dict[str, Any]) -> bo
 
 # Global core manager instance
 _core_manager: Optional[CoreManager] = None
+_core_manager_lock = threading.Lock()
 
 
 def get_core_manager() -> CoreManager:
@@ -307,8 +472,12 @@ def get_core_manager() -> CoreManager:
         CoreManager instance
     """
     global _core_manager
+    # Double-checked locking: the lock is only taken until the first
+    # manager exists, and concurrent first calls create exactly one
     if _core_manager is None:
-        _core_manager = initialize_core_system()
+        with _core_manager_lock:
+            if _core_manager is None:
+                _core_manager = initialize_core_system()
     return _core_manager
 
 
@@ -317,19 +486,14 @@ __all__ = [
     # Core classes
     'BaseAgent',
     'CoreManager',
+    'configure_agent_logging',
     
     # Data models
     'FileMetadata',
     'ExtractionResult', 
     'ClassificationResult',
     'ProcessingStatus',
-    'AgentConfig',
-    'PipelineConfig',
     'ValidationResult',
-    'StructuredData',
-    'ContentElement',
-    'EntityData',
-    'QualityMetrics',
     
     # Constants
     'SUPPORTED_FILE_TYPES',
@@ -340,19 +504,31 @@ __all__ = [
     'QUALITY_THRESHOLDS',
     'DEFAULT_CONFIG',
     'FILE_SIZE_LIMITS',
+    'FILE_VALIDATION_TABLE',
     'PROCESSING_TIMEOUTS',
+    'CONCURRENCY_LIMITS',
+    'EFFECTIVE_ENV',
     
     # Utilities
     'validate_file_path',
     'get_file_metadata',
+    'get_file_metadata_batch',
+    'get_directory_metadata',
+    'scan_file',
+    'get_cached_file_metadata',
+    'invalidate_file_metadata',
     'calculate_file_hash',
     'format_timestamp',
     'sanitize_filename',
     'create_directory_structure',
     'merge_configurations',
+    'merge_configurations_shallow',
+    'get_env',
     'validate_json_schema',
+    'validate_file_metadata',
+    'validate_extraction_result',
+    'extract_all_entities',
     'convert_bytes_to_mb',
-    'estimate_processing_time',
     
     # Exceptions
     'UDIBaseException',
@@ -380,4 +556,4 @@ __all__ = [
 ]
 
 # Initialize logging for the package
-logging.getLogger(__name__).info(f"Core package loaded (v{__version__})")
\ No newline at end of file
+logging.getLogger(__name__).info("Core package loaded (v%s)", __version__)
\ No newline at end of file
@@ -1,12 +1,55 @@
 # src/core/base_agent.py
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, TextIO
 import logging
+import threading
 from datetime import datetime
 import time
 
 from .data_models import ExtractionResult, ExtractionMetadata, AgentException
 
+class _AgentFormatter(logging.Formatter):
+    """Formatter that labels records with the agent name (last logger name component)"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        record.agent_name = record.name.rpartition('.')[2]
+        return super().format(record)
+
+# Libraries must not emit output on import: without configuration, agent
+# records only propagate to whatever handlers the application installed
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+_agent_handler: Optional[logging.Handler] = None
+_agent_handler_lock = threading.Lock()
+
+def configure_agent_logging(stream: Optional[TextIO] = None) -> logging.Handler:
+    """
+    Print agent log records to a stream, labelled with the agent name.
+    
+    For applications that do not configure logging themselves. One handler
+    is shared by every agent logger (they are children of this module's
+    logger), and repeated calls return it unchanged. Records handled here
+    are not propagated, so they are never printed twice.
+    
+    Args:
+        stream: Output stream (defaults to sys.stderr)
+        
+    Returns:
+        The shared agent handler
+    """
+    global _agent_handler
+    with _agent_handler_lock:
+        if _agent_handler is None:
+            handler = logging.StreamHandler(stream)
+            handler.setFormatter(
+                _AgentFormatter('%(asctime)s - %(agent_name)s - %(levelname)s - %(message)s')
+            )
+            module_logger = logging.getLogger(__name__)
+            module_logger.addHandler(handler)
+            module_logger.propagate = False
+            _agent_handler = handler
+        return _agent_handler
+
 class BaseAgent(ABC):
     """Base class for all processing agents"""
     
@@ -18,12 +61,8 @@ class BaseAgent(ABC):
     
     def _setup_logging(self):
         """Setup logging for the agent"""
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            f'%(asctime)s - {self.name} - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
+        # Output goes to the application's handlers, or to the shared one
+        # installed by configure_agent_logging
         self.logger.setLevel(logging.INFO)
     
     @abstractmethod
@@ -47,15 +86,16 @@ class BaseAgent(ABC):
     
     def _log_processing_start(self, input_info: str):
         """Log processing start"""
-        self.logger.info(f"Starting processing: {input_info}")
+        self.logger.info("Starting processing: %s", input_info)
     
     def _log_processing_end(self, result_info: str, processing_time: float):
         """Log processing completion"""
-        self.logger.info(f"Processing completed: {result_info} (took {processing_time:.2f}s)")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Processing completed: %s (took %.2fs)", result_info, processing_time)
     
     def _log_error(self, error: Exception, context: str = ""):
         """Log processing errors"""
-        self.logger.error(f"Error in {context}: {str(error)}", exc_info=True)
+        self.logger.error("Error in %s: %s", context, error, exc_info=True)
     
     async def health_check(self) -> Dict[str, Any]:
         """Health check for the agent"""
@@ -0,0 +1,158 @@
+"""
+JSON Compatibility Module
+
+Drop-in replacement for the subset of the stdlib ``json`` API used across the
+agent pipeline. Serialization is backed by ``orjson`` when it is installed and
+falls back to the stdlib ``json`` module otherwise, so callers can simply do
+``from ...core import compat_json as json``.
+
+Differences from the stdlib that callers should be aware of:
+- Output is always UTF-8 (``ensure_ascii`` is ignored on the orjson path)
+- ``datetime``/``date``/``time``, ``Enum``, dataclasses and ``Path`` objects
+  are serialized natively on both paths
+- ``loads`` hands documents with integers outside the 64-bit range or with
+  ``NaN``/``Infinity`` literals to the stdlib, so those parse exactly as with
+  ``json.loads``; orjson still rejects out-of-range floats (``1e400``) and
+  lone surrogate escapes, which the stdlib accepts
+- Invalid input is parsed once; ``orjson.JSONDecodeError`` subclasses
+  ``json.JSONDecodeError``
+
+Author: Unstructured Data Integration Team
+Version: 1.0.0
+"""
+
+import dataclasses
+import json as _stdlib_json
+from datetime import date, datetime, time
+from enum import Enum
+from pathlib import PurePath
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+JSONDecodeError = _stdlib_json.JSONDecodeError
+
+# Input orjson reads differently from the stdlib: integer literals that may
+# not fit in 64 bits (orjson returns them as floats) and the NaN/Infinity
+# extensions (orjson rejects them). Runs of 19+ digits mark the former;
+# bytes.translate keeps the scan in C. Digits inside strings match too,
+# which only costs a stdlib parse.
+_DIGIT_RUN_TABLE = bytes(0x30 if 0x30 <= c <= 0x39 else c for c in range(256))
+_DIGIT_RUN = b'0' * 19
+
+
+def _needs_stdlib(data: Any) -> bool:
+    """True if orjson would not parse ``data`` exactly like ``json.loads``."""
+    try:
+        raw = data.encode('utf-8') if isinstance(data, str) else bytes(data)
+    except (UnicodeEncodeError, TypeError):
+        # Lone surrogates or non-text input; let the stdlib decide
+        return True
+    return (
+        _DIGIT_RUN in raw.translate(_DIGIT_RUN_TABLE)
+        or b'NaN' in raw
+        or b'Infinity' in raw
+    )
+
+
+def json_default(obj: Any) -> Any:
+    """Serialize the non-JSON types the pipeline commonly emits."""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    if isinstance(obj, PurePath):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _chain_default(default: Optional[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    """Try the caller's default hook first, then the built-in conversions."""
+    if default is None:
+        return json_default
+
+    def chained(obj: Any) -> Any:
+        try:
+            return default(obj)
+        except TypeError:
+            return json_default(obj)
+
+    return chained
+
+
+def dumps_bytes(
+    obj: Any,
+    *,
+    indent: Optional[int] = None,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """
+    Serialize ``obj`` to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with this indentation (orjson only supports 2;
+            other widths use the stdlib encoder)
+        sort_keys: Sort dictionary keys
+        default: Hook for objects that are not natively serializable
+
+    Returns:
+        JSON document as bytes
+    """
+    if HAS_ORJSON and indent in (None, 0, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=_chain_default(default), option=option)
+        except TypeError:
+            # orjson rejects e.g. integers wider than 64 bits; let the stdlib try
+            pass
+
+    return _stdlib_json.dumps(
+        obj,
+        indent=indent or None,
+        sort_keys=sort_keys,
+        default=_chain_default(default),
+        ensure_ascii=False,
+        # Match orjson's compact output when not pretty-printing
+        separators=(',', ': ') if indent else (',', ':'),
+    ).encode('utf-8')
+
+
+def dumps(obj: Any, *, indent: Optional[int] = None, sort_keys: bool = False,
+          default: Optional[Callable[[Any], Any]] = None, **kwargs) -> str:
+    """
+    Serialize ``obj`` to a JSON string.
+
+    Accepts (and ignores) stdlib-only keyword arguments such as
+    ``ensure_ascii`` so existing ``json.dumps`` call sites keep working.
+    """
+    return dumps_bytes(obj, indent=indent, sort_keys=sort_keys, default=default).decode('utf-8')
+
+
+def dump(obj: Any, fp, **kwargs) -> None:
+    """Serialize ``obj`` as JSON to a text-mode file object."""
+    fp.write(dumps(obj, **kwargs))
+
+
+def loads(data: Any) -> Any:
+    """Deserialize a JSON document from ``str``, ``bytes`` or ``bytearray``."""
+    if HAS_ORJSON and not _needs_stdlib(data):
+        return orjson.loads(data)
+    return _stdlib_json.loads(data)
+
+
+def load(fp) -> Any:
+    """Deserialize a JSON document from a file object."""
+    return loads(fp.read())
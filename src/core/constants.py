@@ -16,32 +16,41 @@ Author: Unstructured Data Integration Team
 Version: 1.0.0
 """
 
-from enum import Enum
-from typing import Dict, Any, List, Set
+from types import MappingProxyType
+from typing import Dict, Any, List, FrozenSet, Mapping, Pattern, Tuple
 import os
+import re
+import sys
+
+from .data_models import ProcessingStatus, QualityLevel
+
+# Lookup tables and default configurations below are read-only views
+# (MappingProxyType): accidental writes raise TypeError instead of silently
+# changing behaviour process-wide, and callers may alias them without copying.
+# Merge them into a new dict (utils.merge_configurations) to customize.
 
 # =============================================================================
 # FILE TYPES AND FORMATS
 # =============================================================================
 
 # Supported input file extensions
-SUPPORTED_FILE_TYPES: Set[str] = {
+SUPPORTED_FILE_TYPES: FrozenSet[str] = frozenset({
     'txt', 'html', 'json', 'log',           # Text files
     'pdf', 'docx', 'doc',                   # Document files
     'png', 'jpg', 'jpeg', 'bmp', 'tiff',   # Image files
     'csv', 'xlsx', 'xls'                    # Data files (future support)
-}
+})
 
 # File type categories
-FILE_CATEGORIES: Dict[str, List[str]] = {
+FILE_CATEGORIES: Mapping[str, List[str]] = MappingProxyType({
     'text': ['txt', 'html', 'json', 'log'],
     'document': ['pdf', 'docx', 'doc'],
     'image': ['png', 'jpg', 'jpeg', 'bmp', 'tiff'],
     'data': ['csv', 'xlsx', 'xls']
-}
+})
 
 # MIME type mappings
-MIME_TYPE_MAPPING: Dict[str, str] = {
+MIME_TYPE_MAPPING: Mapping[str, str] = MappingProxyType({
     'txt': 'text/plain',
     'html': 'text/html',
     'json': 'application/json',
@@ -57,7 +66,7 @@ MIME_TYPE_MAPPING: Dict[str, str] = {
     'csv': 'text/csv',
     'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
     'xls': 'application/vnd.ms-excel'
-}
+})
 
 # =============================================================================
 # PIPELINE AND AGENT TYPES
@@ -81,35 +90,21 @@ AGENT_TYPES: List[str] = [
 ]
 
 # Pipeline to agent mapping
-PIPELINE_AGENT_MAPPING: Dict[str, List[str]] = {
+PIPELINE_AGENT_MAPPING: Mapping[str, List[str]] = MappingProxyType({
     'text_pipeline': ['classifier', 'text_extractor', 'context_analysis', 'structured_agent'],
     'ocr_pipeline': ['classifier', 'ocr_extractor', 'context_analysis', 'structured_agent'],
     'hybrid_pipeline': ['classifier', 'hybrid_extractor', 'context_analysis', 'structured_agent']
-}
+})
 
 # =============================================================================
 # STATUS AND ERROR CODES
 # =============================================================================
 
-class ProcessingStatus(Enum):
-    """Processing status enumeration."""
-    PENDING = "pending"
-    PROCESSING = "processing"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    CANCELLED = "cancelled"
-    TIMEOUT = "timeout"
-
-class QualityLevel(Enum):
-    """Data quality level enumeration."""
-    EXCELLENT = "excellent"
-    GOOD = "good"
-    FAIR = "fair"
-    POOR = "poor"
-    UNUSABLE = "unusable"
+# ProcessingStatus and QualityLevel are defined once in data_models and
+# re-exported here, so enum members compare equal wherever they are imported from
 
 # Status codes for API responses
-STATUS_CODES: Dict[str, int] = {
+STATUS_CODES: Mapping[str, int] = MappingProxyType({
     'SUCCESS': 200,
     'CREATED': 201,
     'ACCEPTED': 202,
@@ -121,10 +116,10 @@ STATUS_CODES: Dict[str, int] = {
     'UNPROCESSABLE_ENTITY': 422,
     'INTERNAL_SERVER_ERROR': 500,
     'SERVICE_UNAVAILABLE': 503
-}
+})
 
 # Error codes for different error types
-ERROR_CODES: Dict[str, str] = {
+ERROR_CODES: Mapping[str, str] = MappingProxyType({
     'FILE_NOT_FOUND': 'E001',
     'UNSUPPORTED_FORMAT': 'E002',
     'FILE_TOO_LARGE': 'E003',
@@ -140,23 +135,23 @@ ERROR_CODES: Dict[str, str] = {
     'AGENT_ERROR': 'E013',
     'PIPELINE_ERROR': 'E014',
     'QUALITY_CHECK_FAILED': 'E015'
-}
+})
 
 # =============================================================================
 # QUALITY THRESHOLDS AND METRICS
 # =============================================================================
 
 # Quality score thresholds (0.0 - 1.0)
-QUALITY_THRESHOLDS: Dict[str, float] = {
+QUALITY_THRESHOLDS: Mapping[str, float] = MappingProxyType({
     'EXCELLENT': 0.95,
     'GOOD': 0.80,
     'FAIR': 0.60,
     'POOR': 0.40,
     'UNUSABLE': 0.20
-}
+})
 
 # Confidence thresholds for different operations
-CONFIDENCE_THRESHOLDS: Dict[str, float] = {
+CONFIDENCE_THRESHOLDS: Mapping[str, float] = MappingProxyType({
     'CLASSIFICATION_HIGH': 0.90,
     'CLASSIFICATION_MEDIUM': 0.70,
     'CLASSIFICATION_LOW': 0.50,
@@ -166,22 +161,22 @@ CONFIDENCE_THRESHOLDS: Dict[str, float] = {
     'EXTRACTION_HIGH': 0.88,
     'EXTRACTION_MEDIUM': 0.68,
     'EXTRACTION_LOW': 0.48
-}
+})
 
 # Completeness thresholds
-COMPLETENESS_THRESHOLDS: Dict[str, float] = {
+COMPLETENESS_THRESHOLDS: Mapping[str, float] = MappingProxyType({
     'COMPLETE': 0.95,
     'MOSTLY_COMPLETE': 0.80,
     'PARTIALLY_COMPLETE': 0.60,
     'INCOMPLETE': 0.40
-}
+})
 
 # =============================================================================
 # PROCESSING LIMITS AND TIMEOUTS
 # =============================================================================
 
 # File size limits in MB by file type
-FILE_SIZE_LIMITS: Dict[str, float] = {
+FILE_SIZE_LIMITS: Mapping[str, float] = MappingProxyType({
     'txt': 10.0,
     'html': 20.0,
     'json': 50.0,
@@ -197,10 +192,19 @@ FILE_SIZE_LIMITS: Dict[str, float] = {
     'csv': 500.0,
     'xlsx': 200.0,
     'xls': 200.0
-}
+})
+
+# Size limit in MB for supported types without an explicit entry
+DEFAULT_FILE_SIZE_LIMIT: float = 100.0
+
+# Supported extension -> size limit in MB; a single lookup answers both
+# "is this type supported?" (key present) and "how large may it be?"
+FILE_VALIDATION_TABLE: Mapping[str, float] = MappingProxyType({
+    ext: FILE_SIZE_LIMITS.get(ext, DEFAULT_FILE_SIZE_LIMIT) for ext in SUPPORTED_FILE_TYPES
+})
 
 # Processing timeouts in seconds by operation
-PROCESSING_TIMEOUTS: Dict[str, int] = {
+PROCESSING_TIMEOUTS: Mapping[str, int] = MappingProxyType({
     'classification': 30,
     'text_extraction': 120,
     'ocr_extraction': 300,
@@ -209,30 +213,30 @@ PROCESSING_TIMEOUTS: Dict[str, int] = {
     'structuring': 120,
     'validation': 60,
     'total_pipeline': 1200
-}
+})
 
 # Memory limits in MB
-MEMORY_LIMITS: Dict[str, int] = {
+MEMORY_LIMITS: Mapping[str, int] = MappingProxyType({
     'max_file_cache': 1000,
     'max_result_cache': 500,
     'max_model_memory': 2000,
     'agent_memory_limit': 512
-}
+})
 
 # Concurrency limits
-CONCURRENCY_LIMITS: Dict[str, int] = {
+CONCURRENCY_LIMITS: Mapping[str, int] = MappingProxyType({
     'max_concurrent_files': 10,
     'max_concurrent_agents': 5,
     'max_queue_size': 100,
     'max_retry_attempts': 3
-}
+})
 
 # =============================================================================
 # DEFAULT CONFIGURATIONS
 # =============================================================================
 
 # Default system configuration
-DEFAULT_CONFIG: Dict[str, Any] = {
+DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType({
     'version': '1.0.0',
     'environment': 'development',
     'debug': False,
@@ -244,10 +248,10 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     'max_retries': 3,
     'retry_delay': 1.0,
     'cleanup_temp_files': True
-}
+})
 
 # Default agent configurations
-DEFAULT_AGENT_CONFIG: Dict[str, Dict[str, Any]] = {
+DEFAULT_AGENT_CONFIG: Mapping[str, Dict[str, Any]] = MappingProxyType({
     'classifier': {
         'confidence_threshold': 0.7,
         'enable_hybrid_detection': True,
@@ -284,10 +288,10 @@ DEFAULT_AGENT_CONFIG: Dict[str, Dict[str, Any]] = {
         'quality_check': True,
         'output_format': 'json'
     }
-}
+})
 
 # Default pipeline configurations
-DEFAULT_PIPELINE_CONFIG: Dict[str, Dict[str, Any]] = {
+DEFAULT_PIPELINE_CONFIG: Mapping[str, Dict[str, Any]] = MappingProxyType({
     'text_pipeline': {
         'parallel_processing': False,
         'validate_intermediate': True,
@@ -305,14 +309,14 @@ DEFAULT_PIPELINE_CONFIG: Dict[str, Dict[str, Any]] = {
         'save_intermediate': True,
         'merge_strategy': 'weighted'
     }
-}
+})
 
 # =============================================================================
 # PATHS AND DIRECTORIES
 # =============================================================================
 
 # Base directories
-BASE_DIRS: Dict[str, str] = {
+BASE_DIRS: Mapping[str, str] = MappingProxyType({
     'data': 'data',
     'input': 'data/input',
     'output': 'data/output',
@@ -321,23 +325,23 @@ BASE_DIRS: Dict[str, str] = {
     'models': 'data/models',
     'logs': 'logs',
     'config': 'config'
-}
+})
 
 # Log file names
-LOG_FILES: Dict[str, str] = {
+LOG_FILES: Mapping[str, str] = MappingProxyType({
     'app': 'app.log',
     'error': 'error.log',
     'performance': 'performance.log',
     'access': 'access.log',
     'debug': 'debug.log'
-}
+})
 
 # =============================================================================
 # REGEX PATTERNS
 # =============================================================================
 
 # Common regex patterns for content analysis
-REGEX_PATTERNS: Dict[str, str] = {
+REGEX_PATTERNS: Mapping[str, str] = MappingProxyType({
     'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
     'phone': r'(\+\d{1,3}[-.\s]?)?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}',
     'url': r'https?://(?:[-\w.])+(?::[0-9]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:[\w.])*)?)?',
@@ -347,23 +351,28 @@ REGEX_PATTERNS: Dict[str, str] = {
     'currency': r'\$?\d{1,3}(?:,\d{3})*(?:\.\d{2})?',
     'ssn': r'\d{3}-\d{2}-\d{4}',
     'zip_code': r'\d{5}(?:-\d{4})?'
-}
+})
+
+# REGEX_PATTERNS compiled once at import (case-insensitive, as used for entity extraction)
+COMPILED_PATTERNS: Mapping[str, Pattern[str]] = MappingProxyType({
+    name: re.compile(pattern, re.IGNORECASE) for name, pattern in REGEX_PATTERNS.items()
+})
 
 # =============================================================================
 # MODEL CONFIGURATIONS
 # =============================================================================
 
 # NLP model configurations
-NLP_MODEL_CONFIG: Dict[str, Any] = {
+NLP_MODEL_CONFIG: Mapping[str, Any] = MappingProxyType({
     'spacy_model': 'en_core_web_sm',
     'transformers_model': 'bert-base-uncased',
     'max_sequence_length': 512,
     'batch_size': 32,
     'device': 'auto'  # 'cpu', 'cuda', or 'auto'
-}
+})
 
 # OCR engine configurations
-OCR_ENGINE_CONFIG: Dict[str, Dict[str, Any]] = {
+OCR_ENGINE_CONFIG: Mapping[str, Dict[str, Any]] = MappingProxyType({
     'tesseract': {
         'config': '--oem 3 --psm 6',
         'languages': ['eng'],
@@ -379,14 +388,14 @@ OCR_ENGINE_CONFIG: Dict[str, Dict[str, Any]] = {
         'lang': 'en',
         'use_gpu': False
     }
-}
+})
 
 # =============================================================================
 # API CONFIGURATIONS
 # =============================================================================
 
 # API endpoint configurations
-API_CONFIG: Dict[str, Any] = {
+API_CONFIG: Mapping[str, Any] = MappingProxyType({
     'version': 'v1',
     'title': 'Unstructured Data Integration API',
     'description': 'API for processing unstructured data files',
@@ -396,10 +405,10 @@ API_CONFIG: Dict[str, Any] = {
     'cors_origins': ['*'],
     'docs_url': '/docs',
     'redoc_url': '/redoc'
-}
+})
 
 # Response format templates
-RESPONSE_TEMPLATES: Dict[str, Dict[str, Any]] = {
+RESPONSE_TEMPLATES: Mapping[str, Dict[str, Any]] = MappingProxyType({
     'success': {
         'status': 'success',
         'message': '',
@@ -413,14 +422,14 @@ RESPONSE_TEMPLATES: Dict[str, Dict[str, Any]] = {
         'details': {},
         'timestamp': None
     }
-}
+})
 
 # =============================================================================
 # ENVIRONMENT VARIABLES
 # =============================================================================
 
 # Environment variable names
-ENV_VARS: Dict[str, str] = {
+ENV_VARS: Mapping[str, str] = MappingProxyType({
     'LOG_LEVEL': 'UDI_LOG_LEVEL',
     'DEBUG': 'UDI_DEBUG',
     'CACHE_TTL': 'UDI_CACHE_TTL',
@@ -429,16 +438,24 @@ ENV_VARS: Dict[str, str] = {
     'REDIS_URL': 'UDI_REDIS_URL',
     'SECRET_KEY': 'UDI_SECRET_KEY',
     'ENVIRONMENT': 'UDI_ENVIRONMENT'
-}
+})
 
 # Default environment values
-DEFAULT_ENV_VALUES: Dict[str, str] = {
+DEFAULT_ENV_VALUES: Mapping[str, str] = MappingProxyType({
     'UDI_LOG_LEVEL': 'INFO',
     'UDI_DEBUG': 'False',
     'UDI_CACHE_TTL': '3600',
     'UDI_MAX_FILE_SIZE': '100',
     'UDI_ENVIRONMENT': 'development'
-}
+})
+
+# Effective environment settings, resolved once at import: every variable
+# named in ENV_VARS -> its value from os.environ, else its default (or None).
+# Read through utils.get_env; changes to os.environ after startup are not seen.
+EFFECTIVE_ENV: Mapping[str, Any] = MappingProxyType({
+    env_var: os.environ.get(env_var, DEFAULT_ENV_VALUES.get(env_var))
+    for env_var in ENV_VARS.values()
+})
 
 # =============================================================================
 # VALIDATION SCHEMAS
@@ -459,6 +476,10 @@ FILE_METADATA_SCHEMA: Dict[str, Any] = {
     "required": ["file_path", "file_name", "file_type", "file_size"]
 }
 
+# ProcessingStatus values, built once and interned so schema enum checks
+# usually match on identity
+_STATUS_VALUES: Tuple[str, ...] = tuple(sys.intern(status.value) for status in ProcessingStatus)
+
 # JSON schema for extraction result validation
 EXTRACTION_RESULT_SCHEMA: Dict[str, Any] = {
     "type": "object",
@@ -466,7 +487,7 @@ EXTRACTION_RESULT_SCHEMA: Dict[str, Any] = {
         "file_path": {"type": "string"},
         "content": {"type": "object"},
         "metadata": {"type": "object"},
-        "processing_status": {"type": "string", "enum": [status.value for status in ProcessingStatus]},
+        "processing_status": {"type": "string", "enum": list(_STATUS_VALUES)},
         "quality_metrics": {"type": "object"},
         "extraction_timestamp": {"type": "string", "format": "date-time"}
     },
@@ -3,9 +3,10 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Union
 from enum import Enum
 from datetime import datetime
-import json
 
-class FileType(Enum):
+from . import compat_json
+
+class FileType(str, Enum):
     """Supported file types"""
     HTML = "html"
     TXT = "txt"
@@ -18,20 +19,30 @@ class FileType(Enum):
     JPEG = "jpeg"
     UNKNOWN = "unknown"
 
-class PipelineType(Enum):
+class PipelineType(str, Enum):
     """Available processing pipelines"""
     TEXT = "text"
     OCR = "ocr"
     HYBRID = "hybrid"
 
-class ProcessingStatus(Enum):
+class ProcessingStatus(str, Enum):
     """Processing status indicators"""
     PENDING = "pending"
     PROCESSING = "processing"
     COMPLETED = "completed"
     FAILED = "failed"
+    CANCELLED = "cancelled"
+    TIMEOUT = "timeout"
+
+class QualityLevel(str, Enum):
+    """Data quality level indicators"""
+    EXCELLENT = "excellent"
+    GOOD = "good"
+    FAIR = "fair"
+    POOR = "poor"
+    UNUSABLE = "unusable"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FileMetadata:
     """File metadata structure"""
     filename: str
@@ -43,7 +54,7 @@ class FileMetadata:
     checksum: Optional[str] = None
     encoding: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExtractionMetadata:
     """Metadata about the extraction process"""
     extraction_method: str
@@ -52,7 +63,7 @@ class ExtractionMetadata:
     agent_version: str = "1.0.0"
     timestamp: datetime = field(default_factory=datetime.now)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StructuredElement:
     """Individual structured content element"""
     element_type: str  # paragraph, table, list, heading, etc.
@@ -61,7 +72,7 @@ class StructuredElement:
     metadata: Dict[str, Any] = field(default_factory=dict)
     confidence: float = 1.0
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionResult:
     """Unified extraction result format"""
     metadata: Dict[str, Any]
@@ -71,14 +82,11 @@ class ExtractionResult:
     
     def to_json(self) -> str:
         """Convert to JSON string"""
-        def serialize_datetime(obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            raise TypeError(f"Object {obj} is not JSON serializable")
-        
-        return json.dumps(self.__dict__, default=serialize_datetime, indent=2)
+        # orjson (when installed) serializes the nested dataclasses, enums and
+        # datetimes natively, without a Python-level default hook per object
+        return compat_json.dumps(self, indent=2)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ClassificationResult:
     """Result from file classification"""
     file_type: FileType
@@ -88,6 +96,13 @@ class ClassificationResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
     requires_hybrid: bool = False
 
+@dataclass(slots=True, frozen=True)
+class ValidationResult:
+    """Outcome of validating an input file"""
+    is_valid: bool
+    error_message: Optional[str] = None
+    metadata: Optional[Dict[str, Any]] = None
+
 # Base exceptions
 class AgentException(Exception):
     """Base exception for all agent errors"""
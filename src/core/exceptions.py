@@ -0,0 +1,55 @@
+"""
+Exceptions Module
+
+Exception hierarchy for the Unstructured Data Integration system. Every
+error raised by the core utilities and agents derives from UDIBaseException,
+so callers can catch system errors without masking unrelated failures.
+
+Author: Unstructured Data Integration Team
+Version: 1.0.0
+"""
+
+
+class UDIBaseException(Exception):
+    """Base exception for all system errors"""
+    pass
+
+class FileProcessingError(UDIBaseException):
+    """Error while reading or processing an input file"""
+    pass
+
+class ValidationError(UDIBaseException):
+    """Data failed validation (schema, configuration or input checks)"""
+    pass
+
+class ConfigurationError(UDIBaseException):
+    """Invalid or missing configuration"""
+    pass
+
+class PipelineError(UDIBaseException):
+    """Error while running a processing pipeline"""
+    pass
+
+class AgentError(UDIBaseException):
+    """Error raised by an agent"""
+    pass
+
+class DataExtractionError(AgentError):
+    """Error during content extraction"""
+    pass
+
+class OCRError(DataExtractionError):
+    """Error during OCR extraction"""
+    pass
+
+class StructuringError(AgentError):
+    """Error while structuring extracted content"""
+    pass
+
+class AnalysisError(AgentError):
+    """Error during context analysis"""
+    pass
+
+class QualityError(UDIBaseException):
+    """Extraction result below the required quality"""
+    pass
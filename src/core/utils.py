@@ -23,22 +23,47 @@ import re
 import json
 import hashlib
 import mimetypes
+import mmap
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union, Tuple
+from stat import S_ISREG
+from typing import Dict, Any, List, Mapping, Optional, Union, Tuple
 import time
-from functools import wraps
+import random
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, wraps
 import jsonschema
-from jsonschema import validate, ValidationError as JsonValidationError
+
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    hyperscan = None
+    HAS_HYPERSCAN = False
+
+try:
+    import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    blake3 = None
+    HAS_BLAKE3 = False
 
 from .constants import (
     SUPPORTED_FILE_TYPES,
     FILE_SIZE_LIMITS,
     MIME_TYPE_MAPPING,
-    REGEX_PATTERNS,
-    DEFAULT_ENV_VALUES
+    COMPILED_PATTERNS,
+    DEFAULT_ENV_VALUES,
+    ENV_VARS,
+    EFFECTIVE_ENV,
+    FILE_METADATA_SCHEMA,
+    EXTRACTION_RESULT_SCHEMA
 )
+from .exceptions import ValidationError
+from . import compat_json
 
 logger = logging.getLogger(__name__)
 
@@ -57,13 +82,105 @@ def validate_file_path(file_path: str) -> bool:
         True if file path is valid and accessible
     """
     try:
-        path = Path(file_path)
-        return path.exists() and path.is_file() and os.access(file_path, os.R_OK)
+        # One stat answers both "exists" and "is a regular file"
+        return S_ISREG(os.stat(file_path).st_mode) and os.access(file_path, os.R_OK)
+    except OSError:
+        return False
     except Exception as e:
-        logger.warning(f"File path validation failed for {file_path}: {e}")
+        logger.warning("File path validation failed for %s: %s", file_path, e)
         return False
 
 
+@lru_cache(maxsize=1024)
+def _format_utc_timestamp(timestamp: float) -> str:
+    """
+    ISO-8601 UTC string for an epoch timestamp (memoized).
+    
+    ctime/mtime/atime of one file, and the mtimes of files written together
+    (archive extraction, checkouts), are frequently identical.
+    """
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+# Checksum algorithm for file metadata and calculate_file_hash; single-file
+# and batch metadata must agree on it for checksums to be comparable
+DEFAULT_HASH_ALGORITHM = 'blake2b'
+
+# Leading bytes read while hashing, used to sniff the type of files whose
+# extension is unknown
+MAGIC_PEEK_SIZE = 16
+
+# (signature, MIME type) checked against the start of the file
+_MAGIC_SIGNATURES: Tuple[Tuple[bytes, str], ...] = (
+    (b'%PDF', 'application/pdf'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+    (b'II*\x00', 'image/tiff'),
+    (b'MM\x00*', 'image/tiff'),
+    (b'PK\x03\x04', 'application/zip'),
+)
+
+
+def _sniff_mime_type(head: bytes) -> Optional[str]:
+    """MIME type from a file's leading bytes, or None if unrecognized."""
+    for signature, mime_type in _MAGIC_SIGNATURES:
+        if head.startswith(signature):
+            return mime_type
+    return None
+
+
+def _build_file_metadata(file_path: str, stat: os.stat_result, checksum: str,
+                         head: bytes = b'') -> Dict[str, Any]:
+    """Assemble the metadata dictionary from a stat result, checksum and leading bytes."""
+    path = Path(file_path)
+    
+    # Get file extension and MIME type; the extension decides (a .docx is
+    # also a ZIP), the leading bytes only fill in for unknown extensions
+    file_ext = path.suffix.lower().lstrip('.')
+    mime_type = get_mime_type(file_path)
+    if mime_type == 'application/octet-stream' and head:
+        mime_type = _sniff_mime_type(head) or mime_type
+    
+    return {
+        'file_path': str(path.absolute()),
+        'file_name': path.name,
+        'file_type': file_ext,
+        'file_size': stat.st_size,
+        'mime_type': mime_type,
+        'created_at': _format_utc_timestamp(stat.st_ctime),
+        'modified_at': _format_utc_timestamp(stat.st_mtime),
+        'accessed_at': _format_utc_timestamp(stat.st_atime),
+        'checksum': checksum,
+        'is_supported': file_ext in SUPPORTED_FILE_TYPES,
+        'size_mb': convert_bytes_to_mb(stat.st_size)
+    }
+
+
+def scan_file(file_path: str, algorithm: str = DEFAULT_HASH_ALGORITHM) -> Dict[str, Any]:
+    """
+    Stat, hash and sniff a file in a single pass over its bytes.
+    
+    One open and one mmap serve the checksum, the size/timestamps and the
+    magic-byte MIME check, instead of a separate read for each.
+    
+    Args:
+        file_path: Path to the file
+        algorithm: Hash algorithm for the checksum
+        
+    Returns:
+        Dictionary containing file metadata
+    """
+    try:
+        checksum, head, stat = _hash_file(file_path, algorithm)
+        return _build_file_metadata(file_path, stat, checksum, head)
+        
+    except Exception as e:
+        logger.error("Failed to extract metadata from %s: %s", file_path, e)
+        raise
+
+
 def get_file_metadata(file_path: str) -> Dict[str, Any]:
     """
     Extract comprehensive metadata from a file.
@@ -74,35 +191,180 @@ def get_file_metadata(file_path: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing file metadata
     """
+    return scan_file(file_path)
+
+
+# Files at least this large are hashed on worker threads in
+# get_file_metadata_batch; smaller ones are cheaper to hash inline
+PARALLEL_HASH_MIN_SIZE = 1024 * 1024
+
+
+def get_file_metadata_batch(file_paths: List[str], max_workers: Optional[int] = None,
+                            algorithm: str = DEFAULT_HASH_ALGORITHM) -> List[Dict[str, Any]]:
+    """
+    Extract metadata for many files, hashing large files in parallel.
+    
+    hashlib releases the GIL while hashing, so worker threads scale with the
+    number of cores. Results match get_file_metadata for each path.
+    
+    Args:
+        file_paths: Paths of the files
+        max_workers: Hashing threads (defaults to the CPU count)
+        algorithm: Hash algorithm for the checksums
+        
+    Returns:
+        List of metadata dictionaries, in the same order as file_paths
+        
+    Raises:
+        OSError: If any file cannot be read (as get_file_metadata does)
+    """
+    # Stats first, in one sweep; kept as a parallel list to the paths
+    stats = []
+    for file_path in file_paths:
+        try:
+            stats.append(os.stat(file_path))
+        except OSError as e:
+            logger.error("Failed to extract metadata from %s: %s", file_path, e)
+            raise
+    
+    return _scan_files(file_paths, stats, max_workers, algorithm)
+
+
+def get_directory_metadata(directory_path: str, max_workers: Optional[int] = None,
+                           algorithm: str = DEFAULT_HASH_ALGORITHM) -> List[Dict[str, Any]]:
+    """
+    Extract metadata for every regular file directly inside a directory.
+    
+    Files are found with a single os.scandir() listing; the file-type check
+    uses the listing's entry type, so non-files cost no syscall, and on
+    Windows the entry's stat comes from the listing too. Hashing is shared
+    with get_file_metadata_batch. Symlinks and subdirectories are skipped.
+    
+    Args:
+        directory_path: Directory to scan
+        max_workers: Hashing threads (defaults to the CPU count)
+        algorithm: Hash algorithm for the checksums
+        
+    Returns:
+        List of metadata dictionaries, ordered by file name
+    """
+    file_paths, stats = [], []
+    with os.scandir(directory_path) as entries:
+        for entry in sorted(entries, key=lambda entry: entry.name):
+            if entry.is_file(follow_symlinks=False):
+                file_paths.append(entry.path)
+                stats.append(entry.stat(follow_symlinks=False))
+    
+    return _scan_files(file_paths, stats, max_workers, algorithm)
+
+
+def _scan_files(file_paths: List[str], stats: List[os.stat_result],
+                max_workers: Optional[int], algorithm: str) -> List[Dict[str, Any]]:
+    """Hash files (large ones on worker threads) and build their metadata."""
+    current_path = None
     try:
-        path = Path(file_path)
-        stat = path.stat()
-        
-        # Get file extension and MIME type
-        file_ext = path.suffix.lower().lstrip('.')
-        mime_type = get_mime_type(file_path)
-        
-        metadata = {
-            'file_path': str(path.absolute()),
-            'file_name': path.name,
-            'file_type': file_ext,
-            'file_size': stat.st_size,
-            'mime_type': mime_type,
-            'created_at': datetime.fromtimestamp(stat.st_ctime, tz=timezone.utc).isoformat(),
-            'modified_at': datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).isoformat(),
-            'accessed_at': datetime.fromtimestamp(stat.st_atime, tz=timezone.utc).isoformat(),
-            'checksum': calculate_file_hash(file_path),
-            'is_supported': file_ext in SUPPORTED_FILE_TYPES,
-            'size_mb': convert_bytes_to_mb(stat.st_size)
-        }
-        
-        return metadata
+        # (checksum, leading bytes, stat) per file, or a Future for one
+        scans: List[Any] = [None] * len(file_paths)
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            for index, (file_path, stat) in enumerate(zip(file_paths, stats)):
+                if stat.st_size >= PARALLEL_HASH_MIN_SIZE:
+                    scans[index] = executor.submit(_hash_file, file_path, algorithm)
+            
+            # Hash the small files here while the workers handle large ones
+            for index, file_path in enumerate(file_paths):
+                current_path = file_path
+                if scans[index] is None:
+                    scans[index] = _hash_file(file_path, algorithm)
+            
+            for index, file_path in enumerate(file_paths):
+                current_path = file_path
+                if isinstance(scans[index], Future):
+                    scans[index] = scans[index].result()
+        
+        return [
+            _build_file_metadata(file_path, stat, checksum, head)
+            for file_path, stat, (checksum, head, _) in zip(file_paths, stats, scans)
+        ]
         
     except Exception as e:
-        logger.error(f"Failed to extract metadata from {file_path}: {e}")
+        logger.error("Failed to extract metadata from %s: %s", current_path or 'batch', e)
         raise
 
 
+# Metadata cache: absolute path -> (stat fingerprint, cached_at, metadata)
+_METADATA_CACHE: "OrderedDict[str, Tuple[Tuple[int, int, int], float, Dict[str, Any]]]" = OrderedDict()
+_METADATA_CACHE_LOCK = threading.Lock()
+METADATA_CACHE_MAX_ENTRIES = 4096
+
+
+def get_cached_file_metadata(file_path: str, ttl: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Get file metadata, reusing a cached result while the file is unchanged.
+    
+    Entries are keyed on the file's (mtime_ns, size, inode) fingerprint, so a
+    repeat lookup costs a single stat() instead of re-hashing the file.
+    
+    Args:
+        file_path: Path to the file
+        ttl: Optional maximum age of a cached entry in seconds
+        
+    Returns:
+        Dictionary containing file metadata (a copy; safe to modify)
+    """
+    stat = os.stat(file_path)
+    key = os.path.abspath(file_path)
+    fingerprint = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    now = time.monotonic()
+    
+    with _METADATA_CACHE_LOCK:
+        entry = _METADATA_CACHE.get(key)
+        if entry is not None and entry[0] == fingerprint and (ttl is None or now - entry[1] < ttl):
+            _METADATA_CACHE.move_to_end(key)
+            return dict(entry[2])
+    
+    metadata = get_file_metadata(file_path)
+    
+    with _METADATA_CACHE_LOCK:
+        _METADATA_CACHE[key] = (fingerprint, now, metadata)
+        _METADATA_CACHE.move_to_end(key)
+        while len(_METADATA_CACHE) > METADATA_CACHE_MAX_ENTRIES:
+            _METADATA_CACHE.popitem(last=False)
+    
+    return dict(metadata)
+
+
+def invalidate_file_metadata(file_path: Optional[str] = None) -> None:
+    """
+    Forget cached metadata for a file, or for all files if no path is given.
+    
+    Args:
+        file_path: Path to forget (clears the whole cache when None)
+    """
+    with _METADATA_CACHE_LOCK:
+        if file_path is None:
+            _METADATA_CACHE.clear()
+        else:
+            _METADATA_CACHE.pop(os.path.abspath(file_path), None)
+
+
+def _build_mime_table() -> Dict[str, str]:
+    """Extension (no dot) -> MIME type: the mimetypes registry overlaid with MIME_TYPE_MAPPING."""
+    mimetypes.init()
+    # Compression/alias suffixes (.gz, .tgz, ...) change how guess_type reads
+    # the rest of the name, so they are left to guess_type itself
+    special = set(mimetypes.encodings_map) | set(mimetypes.suffix_map)
+    table = {
+        ext.lstrip('.'): mime_type
+        for ext, mime_type in mimetypes.types_map.items()
+        if ext not in special
+    }
+    table.update(MIME_TYPE_MAPPING)
+    return table
+
+
+_MIME_TABLE = _build_mime_table()
+
+
 def get_mime_type(file_path: str) -> str:
     """
     Get MIME type for a file.
@@ -113,47 +375,139 @@ def get_mime_type(file_path: str) -> str:
     Returns:
         MIME type string
     """
-    file_ext = Path(file_path).suffix.lower().lstrip('.')
+    file_ext = os.path.splitext(file_path)[1][1:].lower()
     
-    # Use custom mapping first
-    if file_ext in MIME_TYPE_MAPPING:
-        return MIME_TYPE_MAPPING[file_ext]
+    # Custom mapping and the mimetypes registry, merged at import
+    mime_type = _MIME_TABLE.get(file_ext)
+    if mime_type is not None:
+        return mime_type
     
-    # Fallback to mimetypes module
+    # Fallback to mimetypes module (handles e.g. compressed .tar.gz)
     mime_type, _ = mimetypes.guess_type(file_path)
     return mime_type or 'application/octet-stream'
 
 
-def calculate_file_hash(file_path: str, algorithm: str = 'sha256') -> str:
+# Files up to this size are hashed through a memory map; larger ones (and
+# files that cannot be mapped) are read in HASH_CHUNK_SIZE blocks
+HASH_MMAP_MAX_SIZE = 1024 * 1024 * 1024
+HASH_CHUNK_SIZE = 1 << 22
+
+# Open flags for one-pass reads (O_SEQUENTIAL/O_BINARY exist on Windows only)
+_SEQUENTIAL_OPEN_FLAGS = getattr(os, 'O_SEQUENTIAL', 0) | getattr(os, 'O_BINARY', 0)
+
+
+def _advise_sequential(fd: int) -> None:
+    """Tell the kernel a file will be read front to back (larger read-ahead)."""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            # Advisory only; some filesystems and special files reject it
+            pass
+
+
+_HASH_CONSTRUCTORS = {
+    'blake2b': hashlib.blake2b,
+    'sha256': hashlib.sha256,
+}
+
+
+def calculate_file_hash(file_path: str, algorithm: str = DEFAULT_HASH_ALGORITHM) -> str:
     """
     Calculate hash for a file.
     
+    The default BLAKE2b is faster than SHA-256 on CPUs without SHA extensions
+    and is sufficient for change detection and deduplication, the checksum's
+    only use here. 'blake3' (if the blake3 package is installed) is faster
+    still; pass 'sha256' where an externally comparable digest is needed.
+    
     Args:
         file_path: Path to the file
-        algorithm: Hash algorithm (md5, sha1, sha256, etc.)
+        algorithm: Hash algorithm (blake2b, blake3, sha256, md5, etc.)
         
     Returns:
         Hexadecimal hash string
     """
     try:
-        hash_obj = hashlib.new(algorithm)
-        
-        with open(file_path, 'rb') as f:
-            # Read file in chunks to handle large files
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_obj.update(chunk)
-        
-        return hash_obj.hexdigest()
+        return _hash_file(file_path, algorithm)[0]
         
     except Exception as e:
-        logger.error(f"Failed to calculate hash for {file_path}: {e}")
+        logger.error("Failed to calculate hash for %s: %s", file_path, e)
         raise
 
 
+def _hash_file(file_path: str, algorithm: str) -> Tuple[str, bytes, os.stat_result]:
+    """
+    Hash a file in a single pass over its bytes.
+    
+    Returns:
+        (hex digest, first MAGIC_PEEK_SIZE bytes, stat result of the open file)
+    """
+    if algorithm == 'blake3' and HAS_BLAKE3:
+        # Zero-copy mmap path, multi-threaded for large files
+        hash_obj = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        hash_obj.update_mmap(file_path)
+        with open(file_path, 'rb') as f:
+            return hash_obj.hexdigest(), f.read(MAGIC_PEEK_SIZE), os.fstat(f.fileno())
+    
+    # Direct constructors for the common cases skip hashlib.new's name lookup
+    constructor = _HASH_CONSTRUCTORS.get(algorithm)
+    hash_obj = constructor() if constructor is not None else hashlib.new(algorithm)
+    
+    # Unbuffered: readinto() below fills our own buffer directly. On
+    # Windows O_SEQUENTIAL requests aggressive read-ahead at open time.
+    fd = os.open(file_path, os.O_RDONLY | _SEQUENTIAL_OPEN_FLAGS)
+    with open(fd, 'rb', buffering=0) as f:
+        stat = os.fstat(fd)
+        _advise_sequential(fd)
+        mapped = None
+        if 0 < stat.st_size <= HASH_MMAP_MAX_SIZE:
+            try:
+                mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Special files (pipes, some network filesystems) cannot be mapped
+                mapped = None
+        
+        if mapped is not None:
+            # Hash straight from the page cache; OpenSSL sees one buffer
+            # and can use its SIMD/SHA-extension code path throughout
+            with mapped:
+                if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                head = mapped[:MAGIC_PEEK_SIZE]
+                hash_obj.update(memoryview(mapped))
+        elif hasattr(hashlib, 'file_digest'):
+            # Python 3.11+: let hashlib drive the read loop. The head is
+            # hashed first, then the already-seeded object is handed over.
+            head = f.read(MAGIC_PEEK_SIZE) or b''
+            hash_obj.update(head)
+            hashlib.file_digest(f, lambda: hash_obj)
+        else:
+            # Chunked reads into one reusable buffer
+            buffer = bytearray(HASH_CHUNK_SIZE)
+            view = memoryview(buffer)
+            head = b''
+            while True:
+                read = f.readinto(buffer)
+                if not read:
+                    break
+                if not head:
+                    head = bytes(view[:min(read, MAGIC_PEEK_SIZE)])
+                hash_obj.update(view[:read])
+    
+    return hash_obj.hexdigest(), head, stat
+
+
+_INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+
+
+@lru_cache(maxsize=4096)
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize filename by removing/replacing invalid characters.
     
+    Results are memoized, as the same names recur across batches.
+    
     Args:
         filename: Original filename
         
@@ -161,7 +515,7 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     # Remove/replace invalid characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    sanitized = _INVALID_FILENAME_CHARS.sub('_', filename)
     
     # Remove leading/trailing whitespace and dots
     sanitized = sanitized.strip(' .')
@@ -170,29 +524,46 @@ def sanitize_filename(filename: str) -> str:
     if not sanitized:
         sanitized = 'unnamed_file'
     
-    # Limit length
+    # Limit length, keeping the extension. Separators were replaced above, so
+    # rpartition on the last dot splits exactly like os.path.splitext.
     if len(sanitized) > 255:
-        name, ext = os.path.splitext(sanitized)
+        name, dot, ext = sanitized.rpartition('.')
+        if dot:
+            ext = dot + ext
+        else:
+            name, ext = sanitized, ''
         sanitized = name[:255-len(ext)] + ext
     
     return sanitized
 
 
+# Absolute paths already created (or found) by create_directory_structure
+_CREATED_DIRS: set = set()
+
+
 def create_directory_structure(path: str) -> bool:
     """
     Create directory structure if it doesn't exist.
     
+    Successfully created paths are remembered for the life of the process, so
+    repeated calls for the same directory make no filesystem calls. A
+    directory removed after that point is not recreated.
+    
     Args:
         path: Directory path to create
         
     Returns:
         True if directory exists or was created successfully
     """
+    abs_path = os.path.abspath(path)
+    if abs_path in _CREATED_DIRS:
+        return True
     try:
-        Path(path).mkdir(parents=True, exist_ok=True)
+        os.makedirs(abs_path, exist_ok=True)
+        _CREATED_DIRS.add(abs_path)
         return True
     except Exception as e:
-        logger.error(f"Failed to create directory {path}: {e}")
+        logger.error("Failed to create directory %s: %s", path, e)
         return False
 
 
@@ -222,6 +593,9 @@ def get_file_size_category(file_size: int) -> str:
 # DATA VALIDATION AND CONVERSION
 # =============================================================================
 
+_BYTES_PER_MB = 1 << 20
+
+
 def convert_bytes_to_mb(bytes_value: int) -> float:
     """
     Convert bytes to megabytes.
@@ -232,7 +606,7 @@ def convert_bytes_to_mb(bytes_value: int) -> float:
     Returns:
         Size in megabytes (rounded to 2 decimal places)
     """
-    return round(bytes_value / (1024 * 1024), 2)
+    return round(bytes_value / _BYTES_PER_MB, 2)
 
 
 def convert_mb_to_bytes(mb_value: float) -> int:
@@ -245,7 +619,64 @@ def convert_mb_to_bytes(mb_value: float) -> int:
     Returns:
         Size in bytes
     """
-    return int(mb_value * 1024 * 1024)
+    return int(mb_value * _BYTES_PER_MB)
+
+
+def _build_schema_validator(schema: Dict[str, Any]):
+    """Check a JSON schema once and return a reusable validator instance for it."""
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+def _run_schema_validator(validator, data: Any) -> bool:
+    """
+    Validate data with a prebuilt validator, raising like ``jsonschema.validate``.
+    
+    Raises:
+        ValidationError: If validation fails
+    """
+    error = jsonschema.exceptions.best_match(validator.iter_errors(data))
+    if error is not None:
+        logger.error("JSON schema validation failed: %s", error.message)
+        raise ValidationError(f"Schema validation failed: {error.message}")
+    return True
+
+
+# Validators for the built-in schemas, checked and built once at import
+FILE_METADATA_VALIDATOR = _build_schema_validator(FILE_METADATA_SCHEMA)
+EXTRACTION_RESULT_VALIDATOR = _build_schema_validator(EXTRACTION_RESULT_SCHEMA)
+
+
+# Validators for caller-supplied schemas: canonical schema JSON -> validator
+_SCHEMA_VALIDATOR_CACHE: "OrderedDict[bytes, Any]" = OrderedDict()
+_SCHEMA_VALIDATOR_CACHE_LOCK = threading.Lock()
+SCHEMA_VALIDATOR_CACHE_MAX_ENTRIES = 128
+
+
+def _get_schema_validator(schema: Dict[str, Any]):
+    """
+    Return a cached validator for ``schema``, building it on first use.
+    
+    The cache is keyed on the schema's canonical JSON rather than its id(), so
+    a schema mutated in place or a new dict reusing a freed id never gets a
+    stale validator. The validator also keeps its resolved $ref registry.
+    """
+    key = compat_json.dumps_bytes(schema, sort_keys=True, default=str)
+    with _SCHEMA_VALIDATOR_CACHE_LOCK:
+        validator = _SCHEMA_VALIDATOR_CACHE.get(key)
+        if validator is not None:
+            _SCHEMA_VALIDATOR_CACHE.move_to_end(key)
+            return validator
+    
+    validator = _build_schema_validator(schema)
+    
+    with _SCHEMA_VALIDATOR_CACHE_LOCK:
+        _SCHEMA_VALIDATOR_CACHE[key] = validator
+        while len(_SCHEMA_VALIDATOR_CACHE) > SCHEMA_VALIDATOR_CACHE_MAX_ENTRIES:
+            _SCHEMA_VALIDATOR_CACHE.popitem(last=False)
+    
+    return validator
 
 
 def validate_json_schema(data: Dict[str, Any], schema: Dict[str, Any]) -> bool:
@@ -263,16 +694,58 @@ def validate_json_schema(data: Dict[str, Any], schema: Dict[str, Any]) -> bool:
         ValidationError: If validation fails
     """
     try:
-        validate(instance=data, schema=schema)
-        return True
-    except JsonValidationError as e:
-        logger.error(f"JSON schema validation failed: {e.message}")
-        raise ValidationError(f"Schema validation failed: {e.message}")
+        return _run_schema_validator(_get_schema_validator(schema), data)
+    except ValidationError:
+        raise
     except Exception as e:
-        logger.error(f"JSON schema validation error: {e}")
+        logger.error("JSON schema validation error: %s", e)
         raise ValidationError(f"Schema validation error: {e}")
 
 
+def validate_file_metadata(data: Dict[str, Any]) -> bool:
+    """
+    Validate file metadata against FILE_METADATA_SCHEMA.
+    
+    Args:
+        data: File metadata dictionary
+        
+    Returns:
+        True if validation passes
+        
+    Raises:
+        ValidationError: If validation fails
+    """
+    return _run_schema_validator(FILE_METADATA_VALIDATOR, data)
+
+
+def validate_extraction_result(data: Dict[str, Any]) -> bool:
+    """
+    Validate an extraction result against EXTRACTION_RESULT_SCHEMA.
+    
+    Args:
+        data: Extraction result dictionary
+        
+    Returns:
+        True if validation passes
+        
+    Raises:
+        ValidationError: If validation fails
+    """
+    return _run_schema_validator(EXTRACTION_RESULT_VALIDATOR, data)
+
+
+# Characters a JSON document (as accepted by json.loads) can start with,
+# including leading whitespace and the NaN/Infinity extensions
+_JSON_START_CHARS = frozenset('{["tfnNI-0123456789 \t\n\r')
+
+
+def _cannot_be_json(json_string: Any) -> bool:
+    """Cheap pre-check: True if ``json_string`` is a string no parser would accept."""
+    return isinstance(json_string, str) and (
+        not json_string or json_string[0] not in _JSON_START_CHARS
+    )
+
+
 def is_valid_json(json_string: str) -> bool:
     """
     Check if string is valid JSON.
@@ -283,8 +756,10 @@ def is_valid_json(json_string: str) -> bool:
     Returns:
         True if string is valid JSON
     """
+    if _cannot_be_json(json_string):
+        return False
     try:
-        json.loads(json_string)
+        compat_json.loads(json_string)
         return True
     except (json.JSONDecodeError, TypeError):
         return False
@@ -301,13 +776,23 @@ def safe_json_loads(json_string: str, default: Any = None) -> Any:
     Returns:
         Parsed JSON or default value
     """
+    if _cannot_be_json(json_string):
+        logger.warning("JSON parsing failed: input does not start like a JSON document")
+        return default
     try:
-        return json.loads(json_string)
+        return compat_json.loads(json_string)
     except (json.JSONDecodeError, TypeError) as e:
-        logger.warning(f"JSON parsing failed: {e}")
+        logger.warning("JSON parsing failed: %s", e)
         return default
 
 
+# C0 and C1 control characters. str.translate with a deletion table is
+# fastest on ASCII strings; CPython's translate slow path makes the regex
+# faster for non-ASCII text.
+_CONTROL_CHAR_TABLE = dict.fromkeys([*range(0x00, 0x20), *range(0x7f, 0xa0)])
+_CONTROL_CHARS = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+
+
 def normalize_text(text: str) -> str:
     """
     Normalize text by removing extra whitespace and standardizing format.
@@ -321,11 +806,14 @@ def normalize_text(text: str) -> str:
     if not text:
         return ""
     
-    # Remove extra whitespace
-    normalized = re.sub(r'\s+', ' ', text.strip())
+    # Remove extra whitespace (split() uses the same definition as re's \s)
+    normalized = ' '.join(text.split())
     
     # Remove control characters
-    normalized = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', normalized)
+    if normalized.isascii():
+        normalized = normalized.translate(_CONTROL_CHAR_TABLE)
+    else:
+        normalized = _CONTROL_CHARS.sub('', normalized)
     
     return normalized
 
@@ -341,15 +829,130 @@ def extract_entities_with_regex(text: str, entity_type: str) -> List[str]:
     Returns:
         List of extracted entities
     """
-    if entity_type not in REGEX_PATTERNS:
-        logger.warning(f"Unknown entity type: {entity_type}")
+    pattern = COMPILED_PATTERNS.get(entity_type)
+    if pattern is None:
+        logger.warning("Unknown entity type: %s", entity_type)
         return []
     
-    pattern = REGEX_PATTERNS[entity_type]
-    matches = re.findall(pattern, text, re.IGNORECASE)
+    # Stream matches instead of materializing findall's full list; values are
+    # the same as findall's (whole match, the single group, or a group tuple)
+    if pattern.groups == 0:
+        values = (match.group() for match in pattern.finditer(text))
+    elif pattern.groups == 1:
+        values = (match.group(1) or '' for match in pattern.finditer(text))
+    else:
+        values = (match.groups('') for match in pattern.finditer(text))
     
     # Remove duplicates while preserving order
-    return list(dict.fromkeys(matches))
+    seen = set()
+    entities = []
+    for value in values:
+        if value not in seen:
+            seen.add(value)
+            entities.append(value)
+    
+    return entities
+
+
+# Control characters that Python's str \s matches but Hyperscan's (PCRE) \s
+# does not; texts containing them skip the prefilter
+_HS_UNSAFE_CHARS = ('\x1c', '\x1d', '\x1e', '\x1f')
+_HS_FLAGS = (hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH) if HAS_HYPERSCAN else 0
+_hs_local = threading.local()
+
+
+@lru_cache(maxsize=1)
+def _get_entity_prefilter() -> Optional[Tuple[Any, Tuple[str, ...]]]:
+    """
+    Build a Hyperscan database over COMPILED_PATTERNS, once.
+    
+    Returns:
+        (database, entity type per expression id), or None if Hyperscan is
+        unavailable or accepts none of the patterns
+    """
+    if not HAS_HYPERSCAN:
+        return None
+    
+    names, expressions = [], []
+    for name, pattern in COMPILED_PATTERNS.items():
+        expression = pattern.pattern.encode('ascii')
+        try:
+            hyperscan.Database().compile(expressions=[expression], flags=_HS_FLAGS)
+        except hyperscan.error as e:
+            # Unsupported syntax: this type is always extracted with re
+            logger.debug("Hyperscan cannot compile '%s' pattern: %s", name, e)
+            continue
+        names.append(name)
+        expressions.append(expression)
+    
+    if not names:
+        return None
+    
+    database = hyperscan.Database()
+    database.compile(
+        expressions=expressions,
+        ids=list(range(len(names))),
+        elements=len(names),
+        flags=[_HS_FLAGS] * len(names)
+    )
+    return database, tuple(names)
+
+
+def _record_match(expression_id: int, start: int, end: int, flags: int, found: set) -> None:
+    """Hyperscan match handler: note which expression matched."""
+    found.add(expression_id)
+
+
+def _absent_entity_types(text: str) -> frozenset:
+    """
+    Entity types proven not to occur in ``text`` by a single Hyperscan pass.
+    
+    Only ASCII text is prefiltered, where Hyperscan's character classes agree
+    with Python's; anything else returns an empty set (nothing ruled out).
+    """
+    prefilter = _get_entity_prefilter()
+    if prefilter is None or not text.isascii() or any(c in text for c in _HS_UNSAFE_CHARS):
+        return frozenset()
+    
+    database, names = prefilter
+    # Scratch space must not be shared between concurrent scans
+    scratch = getattr(_hs_local, 'scratch', None)
+    if scratch is None:
+        scratch = _hs_local.scratch = hyperscan.Scratch(database)
+    
+    found: set = set()
+    database.scan(text.encode('ascii'), match_event_handler=_record_match, context=found, scratch=scratch)
+    return frozenset(name for index, name in enumerate(names) if index not in found)
+
+
+def extract_all_entities(text: str, entity_types: Optional[List[str]] = None) -> Dict[str, List[str]]:
+    """
+    Extract several entity types from text.
+    
+    With Hyperscan installed, one pass over the text determines which entity
+    types occur at all, and only those are extracted with their regex; the
+    results are identical to calling extract_entities_with_regex per type.
+    
+    Args:
+        text: Text to search
+        entity_types: Entity types to extract (all known types if None)
+        
+    Returns:
+        Dictionary mapping entity type to its extracted entities
+    """
+    if entity_types is None:
+        entity_types = list(COMPILED_PATTERNS)
+    
+    absent = _absent_entity_types(text) if len(entity_types) > 1 else frozenset()
+    
+    results = {}
+    for entity_type in entity_types:
+        if entity_type in absent:
+            results[entity_type] = []
+        else:
+            results[entity_type] = extract_entities_with_regex(text, entity_type)
+    
+    return results
 
 
 # =============================================================================
@@ -369,18 +972,49 @@ def merge_configurations(*configs: Dict[str, Any]) -> Dict[str, Any]:
     result = {}
     
     for config in configs:
-        if not isinstance(config, dict):
+        # Read-only constants (MappingProxyType) are merged like plain dicts
+        if not isinstance(config, Mapping):
             continue
-            
-        for key, value in config.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = merge_configurations(result[key], value)
-            else:
-                result[key] = value
+        
+        # Iterative deep merge: (destination, source) pairs still to merge
+        stack = [(result, config)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, Mapping) and isinstance(value, Mapping):
+                    # Copy before merging so the input configs are never modified
+                    merged = dict(current)
+                    target[key] = merged
+                    stack.append((merged, value))
+                else:
+                    # Unmerged branches are shared, not copied
+                    target[key] = value
     
     return result
 
 
+def merge_configurations_shallow(*configs: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Merge flat configuration dictionaries; later keys override earlier ones.
+    
+    Equivalent to merge_configurations when no earlier config has a mapping
+    value (e.g. CORE_CONFIG), but done in C by dict unpacking. Use
+    merge_configurations for nested configurations such as agent configs.
+    
+    Args:
+        configs: Configuration dictionaries to merge
+        
+    Returns:
+        Merged configuration dictionary
+    """
+    result: Dict[str, Any] = {}
+    for config in configs:
+        if isinstance(config, Mapping):
+            result.update(config)
+    return result
+
+
 def load_config_from_env(prefix: str = 'UDI_') -> Dict[str, str]:
     """
     Load configuration from environment variables.
@@ -391,21 +1025,36 @@ def load_config_from_env(prefix: str = 'UDI_') -> Dict[str, str]:
     Returns:
         Dictionary of configuration values
     """
-    config = {}
-    
-    for key, value in os.environ.items():
-        if key.startswith(prefix):
-            config_key = key[len(prefix):].lower()
-            config[config_key] = value
+    prefix_len = len(prefix)
+    config = {
+        key[prefix_len:].lower(): value
+        for key, value in os.environ.items()
+        if key.startswith(prefix)
+    }
     
-    # Apply defaults for missing values
-    for env_var, default_value in DEFAULT_ENV_VALUES.items():
-        if env_var.startswith(prefix):
-            config_key = env_var[len(prefix):].lower()
-            if config_key not in config:
-                config[config_key] = default_value
+    # Apply defaults for missing values (appended after the environment's keys)
+    defaults = {
+        env_var[prefix_len:].lower(): default_value
+        for env_var, default_value in DEFAULT_ENV_VALUES.items()
+        if env_var.startswith(prefix)
+    }
+    return config | {key: value for key, value in defaults.items() if key not in config}
+
+
+def get_env(name: str, default: Any = None) -> Any:
+    """
+    Get an environment setting from the startup snapshot.
     
-    return config
+    Args:
+        name: Setting key from ENV_VARS (e.g. 'LOG_LEVEL') or the variable
+            name itself (e.g. 'UDI_LOG_LEVEL')
+        default: Value returned when the setting is unset and has no default
+        
+    Returns:
+        Environment value, its DEFAULT_ENV_VALUES entry, or ``default``
+    """
+    value = EFFECTIVE_ENV.get(ENV_VARS.get(name, name))
+    return default if value is None else value
 
 
 def validate_config_types(config: Dict[str, Any], type_mapping: Dict[str, type]) -> Dict[str, Any]:
@@ -437,7 +1086,7 @@ def validate_config_types(config: Dict[str, Any], type_mapping: Dict[str, type])
                     validated_config[key] = [item.strip() for item in value.split(',')]
                 
             except (ValueError, TypeError) as e:
-                logger.warning(f"Failed to convert config key '{key}' to {expected_type}: {e}")
+                logger.warning("Failed to convert config key '%s' to %s: %s", key, expected_type, e)
     
     return validated_config
 
@@ -462,14 +1111,22 @@ def format_timestamp(timestamp: Optional[datetime] = None, format_string: str =
     return timestamp.strftime(format_string)
 
 
-def retry_on_exception(max_retries: int = 3, delay_seconds: float = 1.0, exceptions: Tuple = (Exception,)):
+def retry_on_exception(max_retries: int = 3, delay_seconds: float = 1.0, exceptions: Tuple = (Exception,),
+                       backoff: float = 2.0, max_delay_seconds: float = 30.0):
     """
     Decorator to retry a function on specified exceptions.
     
+    The function runs at most ``max_retries + 1`` times. The wait before retry
+    ``n`` (from 0) is ``delay_seconds * backoff ** n``, capped at
+    ``max_delay_seconds``, plus up to 10% of ``delay_seconds`` of random jitter
+    so that concurrent callers do not retry in lockstep.
+    
     Args:
         max_retries: Maximum number of retries
-        delay_seconds: Delay between retries in seconds
+        delay_seconds: Delay before the first retry in seconds
         exceptions: Tuple of exception classes to catch
+        backoff: Multiplier applied to the delay after each retry
+        max_delay_seconds: Upper bound for the delay between retries
         
     Returns:
         Decorated function with retry logic
@@ -477,15 +1134,15 @@ def retry_on_exception(max_retries: int = 3, delay_seconds: float = 1.0, excepti
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            attempts = 0
-            while attempts < max_retries:
+            for attempt in range(max_retries + 1):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    attempts += 1
-                    logger.warning(f"Exception caught in {func.__name__}: {e}. Retrying {attempts}/{max_retries}...")
-                    time.sleep(delay_seconds)
-            # Final attempt
-            return func(*args, **kwargs)
+                    if attempt == max_retries:
+                        raise
+                    logger.warning("Exception caught in %s: %s. Retrying %d/%d...",
+                                   func.__name__, e, attempt + 1, max_retries)
+                    delay = min(delay_seconds * backoff ** attempt, max_delay_seconds)
+                    time.sleep(delay + random.uniform(0, delay_seconds * 0.1))
         return wrapper
     return decorator
@@ -0,0 +1,62 @@
+"""
+Wire Format Module
+
+Binary serialization for passing extraction results between agents and
+pipelines inside the system. Internal hops use MessagePack, which avoids
+JSON tokenization and produces smaller payloads for the large ``raw_text`` and
+``structured_elements`` fields; JSON is only produced at the API boundary.
+
+``msgpack`` is optional and not part of requirements.txt; install it
+to enable the binary format. Without it the module transparently falls back
+to the JSON encoding from ``compat_json``. Both sides of a hop must use this
+module (``pack``/``unpack``) in the same environment so they agree on the
+format.
+
+Author: Unstructured Data Integration Team
+Version: 1.0.0
+"""
+
+from typing import Any
+
+from .compat_json import dumps_bytes, json_default, loads
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    msgpack = None
+    HAS_MSGPACK = False
+
+
+def pack(obj: Any) -> bytes:
+    """
+    Serialize ``obj`` for internal transport.
+
+    Datetimes, enums, dataclasses (e.g. ``ExtractionResult``) and paths are
+    converted the same way as in JSON output, so ``unpack`` returns plain
+    dicts/lists equivalent to the parsed JSON representation.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        Serialized payload
+    """
+    if HAS_MSGPACK:
+        return msgpack.packb(obj, default=json_default, use_bin_type=True)
+    return dumps_bytes(obj)
+
+
+def unpack(data: bytes) -> Any:
+    """
+    Deserialize a payload produced by ``pack``.
+
+    Args:
+        data: Serialized payload
+
+    Returns:
+        Deserialized object
+    """
+    if HAS_MSGPACK:
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+    return loads(data)
@@ -0,0 +1,5 @@
+from src.agents.text_extractor.parsers import url_parser
+from src.core import compat_json
+
+def test_url_parser_uses_compat_json_in_package_mode():
+    assert url_parser.json is compat_json
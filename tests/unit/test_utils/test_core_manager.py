@@ -0,0 +1,122 @@
+import threading
+
+import pytest
+import src.core as core
+from src.core import CoreManager, invalidate_file_metadata
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    # CoreManager creates its working directories relative to the cwd
+    monkeypatch.chdir(tmp_path)
+    invalidate_file_metadata()
+    yield CoreManager()
+    invalidate_file_metadata()
+
+@pytest.fixture
+def files(tmp_path):
+    data = tmp_path / "files"
+    data.mkdir()
+    (data / "a.txt").write_text("alpha")
+    (data / "b.json").write_text('{"b": 1}')
+    (data / "c.html").write_text("<p>c</p>")
+    (data / "tool.exe").write_bytes(b"MZ")
+    (data / "nested.txt").mkdir()
+    return data
+
+def test_validate_files_bulk_preserves_order_and_duplicates(manager, files):
+    paths = [str(files / "c.html"), str(files / "a.txt"), str(files / "b.json"),
+             str(files / "a.txt"), str(files / "." / "a.txt")]
+
+    results = manager.validate_files_bulk(paths)
+
+    assert [result.is_valid for result in results] == [True] * 5
+    assert [result.metadata["file_name"] for result in results] == \
+        ["c.html", "a.txt", "b.json", "a.txt", "a.txt"]
+
+def test_validate_files_bulk_reports_missing_files_and_directories(manager, files):
+    paths = [str(files / "missing.txt"), str(files / "missing_dir" / "a.txt"),
+             str(files / "nested.txt"), str(files / "a.txt")]
+
+    results = manager.validate_files_bulk(paths)
+
+    assert [result.is_valid for result in results] == [False, False, False, True]
+    assert all(result.error_message == "Invalid file path" for result in results[:3])
+
+def test_validate_files_bulk_rejects_before_hashing(manager, files, monkeypatch):
+    hashed = []
+    def fake_metadata(path, ttl=None):
+        hashed.append(path)
+        return {"file_path": path}
+    monkeypatch.setattr(core, "get_cached_file_metadata", fake_metadata)
+    monkeypatch.setattr(core, "FILE_VALIDATION_TABLE", dict(core.FILE_VALIDATION_TABLE, txt=0.01))
+    (files / "big.txt").write_bytes(b"x" * 20000)
+
+    results = manager.validate_files_bulk(
+        [str(files / "tool.exe"), str(files / "big.txt"), str(files / "b.json")]
+    )
+
+    assert results[0].error_message == "Unsupported file type: exe"
+    assert results[1].error_message.startswith("File size (0.02MB) exceeds limit")
+    assert results[2].is_valid
+    assert hashed == [str(files / "b.json")]
+
+def test_validate_files_bulk_matches_validate_file(manager, files):
+    paths = [str(files / name) for name in
+             ("a.txt", "b.json", "c.html", "tool.exe", "nested.txt", "missing.txt",
+              "A.TXT", "nested.txt/../a.txt", "absent/../a.txt")]
+
+    bulk = manager.validate_files_bulk(paths)
+
+    # Metadata comes from the shared cache, so the single-file results are
+    # identical, including access times
+    assert bulk == [manager.validate_file(path) for path in paths]
+
+def test_resolve_core_config_merges_overrides_into_fresh_copies():
+    default = core._resolve_core_config(None)
+    assert default == dict(core.CORE_CONFIG)
+    default["log_level"] = "DEBUG"
+
+    first = core._resolve_core_config({"log_level": "WARNING", "cache_ttl": 60})
+    first["cache_ttl"] = 0
+    second = core._resolve_core_config({"cache_ttl": 60, "log_level": "WARNING"})
+
+    assert second == dict(core.CORE_CONFIG, log_level="WARNING", cache_ttl=60)
+    assert core._resolve_core_config(None)["log_level"] == core.CORE_CONFIG["log_level"]
+    # Equal but differently typed values are cached separately
+    assert core._resolve_core_config({"metrics_enabled": 1})["metrics_enabled"] is not True
+    # Unhashable values bypass the cache
+    assert core._resolve_core_config({"extra": {"a": 1}})["extra"] == {"a": 1}
+
+def test_get_core_manager_returns_one_instance_across_threads(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(core, "_core_manager", None)
+    created = []
+    def initialize(config=None):
+        created.append(CoreManager(config))
+        return created[-1]
+    monkeypatch.setattr(core, "initialize_core_system", initialize)
+
+    barrier = threading.Barrier(8)
+    managers = []
+    def worker():
+        barrier.wait()
+        managers.append(core.get_core_manager())
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(manager is created[0] for manager in managers)
+    assert core.get_core_manager() is created[0]
+
+def test_validate_file_rejects_type_and_size_before_hashing(manager, files, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("metadata fetched for a rejected file")
+    monkeypatch.setattr(core, "get_cached_file_metadata", fail)
+    monkeypatch.setattr(core, "FILE_VALIDATION_TABLE", dict(core.FILE_VALIDATION_TABLE, txt=0.01))
+    (files / "big.txt").write_bytes(b"x" * 20000)
+
+    assert manager.validate_file(str(files / "tool.exe")).error_message == "Unsupported file type: exe"
+    assert manager.validate_file(str(files / "big.txt")).error_message.startswith("File size (0.02MB)")
@@ -0,0 +1,79 @@
+import pytest
+from src.core import utils
+from src.core.utils import get_directory_metadata, get_file_metadata, get_file_metadata_batch
+
+def _without_atime(metadata):
+    # Hashing a file may update its access time between calls
+    return [{key: value for key, value in item.items() if key != "accessed_at"} for item in metadata]
+
+def test_batch_and_directory_metadata_match_single_file(tmp_path):
+    (tmp_path / "a.txt").write_text("alpha")
+    (tmp_path / "b.json").write_text('{"b": 1}')
+    paths = [str(tmp_path / "a.txt"), str(tmp_path / "b.json")]
+
+    single = _without_atime([get_file_metadata(path) for path in paths])
+
+    assert _without_atime(get_file_metadata_batch(paths)) == single
+    assert _without_atime(get_directory_metadata(str(tmp_path))) == single
+
+@pytest.fixture
+def counted_metadata(monkeypatch):
+    # Count real metadata computations behind the cache
+    calls = []
+    real = utils.get_file_metadata
+    def counting(path):
+        calls.append(path)
+        return real(path)
+    monkeypatch.setattr(utils, "get_file_metadata", counting)
+    utils.invalidate_file_metadata()
+    yield calls
+    utils.invalidate_file_metadata()
+
+def test_cached_file_metadata_hits_while_unchanged(tmp_path, counted_metadata):
+    path = tmp_path / "a.txt"
+    path.write_text("alpha")
+
+    first = utils.get_cached_file_metadata(str(path))
+    first["checksum"] = "mutated"
+    second = utils.get_cached_file_metadata(str(path))
+
+    assert counted_metadata == [str(path)]
+    assert second["checksum"] != "mutated"
+
+def test_cached_file_metadata_evicts_least_recently_used(tmp_path, counted_metadata, monkeypatch):
+    monkeypatch.setattr(utils, "METADATA_CACHE_MAX_ENTRIES", 2)
+    paths = []
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (tmp_path / name).write_text(name)
+        paths.append(str(tmp_path / name))
+
+    utils.get_cached_file_metadata(paths[0])
+    utils.get_cached_file_metadata(paths[1])
+    utils.get_cached_file_metadata(paths[0])  # a is now most recently used
+    utils.get_cached_file_metadata(paths[2])  # evicts b
+
+    assert list(utils._METADATA_CACHE) == [paths[0], paths[2]]
+    utils.get_cached_file_metadata(paths[1])
+    assert counted_metadata == [paths[0], paths[1], paths[2], paths[1]]
+
+def test_cached_file_metadata_refreshes_when_file_changes(tmp_path, counted_metadata):
+    path = tmp_path / "a.txt"
+    path.write_text("alpha")
+    before = utils.get_cached_file_metadata(str(path))
+
+    path.write_text("alpha, longer")
+    after = utils.get_cached_file_metadata(str(path))
+
+    assert len(counted_metadata) == 2
+    assert after["file_size"] != before["file_size"]
+    assert after["checksum"] != before["checksum"]
+
+def test_invalidate_file_metadata_forgets_entry(tmp_path, counted_metadata):
+    path = tmp_path / "a.txt"
+    path.write_text("alpha")
+
+    utils.get_cached_file_metadata(str(path))
+    utils.invalidate_file_metadata(str(path))
+    utils.get_cached_file_metadata(str(path))
+
+    assert len(counted_metadata) == 2
@@ -0,0 +1,41 @@
+import io
+import logging
+
+from src.core import base_agent
+
+class _Recorder(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+def test_base_agent_import_installs_no_output_handler():
+    module_logger = logging.getLogger(base_agent.__name__)
+    assert all(isinstance(handler, logging.NullHandler) for handler in module_logger.handlers)
+    assert module_logger.propagate
+
+def test_agent_records_reach_root_handler_once():
+    root_handler = _Recorder()
+    logging.getLogger().addHandler(root_handler)
+    try:
+        logging.getLogger(f"{base_agent.__name__}.demo").warning("hello")
+    finally:
+        logging.getLogger().removeHandler(root_handler)
+
+    assert [record.getMessage() for record in root_handler.records] == ["hello"]
+
+def test_configure_agent_logging_is_idempotent(monkeypatch):
+    module_logger = logging.getLogger(base_agent.__name__)
+    monkeypatch.setattr(base_agent, "_agent_handler", None)
+    monkeypatch.setattr(module_logger, "handlers", list(module_logger.handlers))
+    monkeypatch.setattr(module_logger, "propagate", True)
+    stream = io.StringIO()
+
+    handler = base_agent.configure_agent_logging(stream)
+    assert base_agent.configure_agent_logging() is handler
+    logging.getLogger(f"{base_agent.__name__}.demo").warning("hello")
+
+    assert module_logger.handlers.count(handler) == 1
+    assert stream.getvalue().count("demo - WARNING - hello") == 1
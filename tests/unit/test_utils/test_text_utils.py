@@ -0,0 +1,37 @@
+import random
+
+import pytest
+from src.core import utils
+from src.core.constants import COMPILED_PATTERNS
+from src.core.utils import extract_all_entities, extract_entities_with_regex
+
+SAMPLES = [
+    "",
+    "plain words only",
+    "Mail a.b@example.com or call +1 (555) 123-4567 by 2024-01-31",
+    "Paid $1,234.56 on 12/31/2023 from ZIP 94103-1234, SSN 123-45-6789",
+    "See https://example.com/path?q=1#top and http://a.b:8080/",
+    "Café user@dömain.de 42",
+    "tab\x1cseparated 555\x1d123 4567",
+]
+
+def _per_type(text):
+    return {name: extract_entities_with_regex(text, name) for name in COMPILED_PATTERNS}
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_extract_all_entities_matches_per_type_regex(text):
+    assert extract_all_entities(text) == _per_type(text)
+
+def test_extract_all_entities_random_inputs_match_per_type_regex():
+    rng = random.Random(0)
+    alphabet = "abcXYZ0123456789@.-_/:$,()+# \t\n?=&%\x1cé"
+    for _ in range(500):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+        assert extract_all_entities(text) == _per_type(text)
+
+@pytest.mark.skipif(not utils.HAS_HYPERSCAN, reason="hyperscan not installed")
+def test_hyperscan_prefilter_rules_out_absent_types():
+    assert utils._get_entity_prefilter() is not None
+    absent = utils._absent_entity_types("plain words only")
+    assert "email" in absent
+    assert "email" not in utils._absent_entity_types("write to a.b@example.com")
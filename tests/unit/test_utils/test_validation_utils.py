@@ -0,0 +1,33 @@
+import pytest
+from src.core.exceptions import ValidationError
+from src.core import compat_json
+from src.core.utils import is_valid_json, safe_json_loads, validate_file_metadata, validate_json_schema
+
+def test_validate_file_metadata_rejects_missing_fields():
+    with pytest.raises(ValidationError):
+        validate_file_metadata({})
+
+def test_validate_json_schema_rejects_invalid_schema():
+    with pytest.raises(ValidationError):
+        validate_json_schema({"a": 1}, {"type": "not-a-type"})
+
+def test_validate_json_schema_accepts_valid_data():
+    schema = {"type": "object", "required": ["a"], "properties": {"a": {"type": "integer"}}}
+    assert validate_json_schema({"a": 1}, schema) is True
+
+def test_safe_json_loads_keeps_wide_integers_exact():
+    assert safe_json_loads('123456789012345678901234567890') == 123456789012345678901234567890
+    assert safe_json_loads('{"id": -9223372036854775809}') == {"id": -9223372036854775809}
+
+def test_compat_json_loads_matches_stdlib_outside_64_bits():
+    assert compat_json.loads(b'[18446744073709551616, NaN]')[0] == 18446744073709551616
+    assert isinstance(compat_json.loads('{"a": 99999999999999999999}')["a"], int)
+
+def test_is_valid_json():
+    assert is_valid_json('{"a": [1, 2.5, null]}')
+    assert not is_valid_json('{"a":')
+    assert not is_valid_json('hello')
+
+def test_compat_json_keeps_separator_lines_on_fast_path():
+    assert not compat_json._needs_stdlib('{"rule": "' + "-" * 40 + '"}')
+    assert compat_json._needs_stdlib('[-9223372036854775809]')